@@ -13,27 +13,59 @@ Usage:
     python pf2_extract_v6.py              # Télécharge et indexe
     python pf2_extract_v6.py --clean      # Repart de zéro
     python pf2_extract_v6.py --local      # Sans télécharger
+    python pf2_extract_v6.py --no-cache   # Ignore le cache d'extraction
 """
 
+import gzip
+import hashlib
 import json
+import mmap
+import os
+import pickle
 import shutil
 import subprocess
 import sys
 import re
 import sqlite3
+import unicodedata
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import orjson  # Optionnel: (dé)codage JSON en C, nettement plus rapide
+    json_loads = orjson.loads
+    
+    def json_dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:  # Entiers hors 64 bits, etc.
+            return json.dumps(obj, ensure_ascii=False)
+except ImportError:
+    json_loads = json.loads  # Accepte aussi les bytes (UTF-8)
+    
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+try:
+    import zstandard  # Optionnel: cache d'extraction plus compact et plus rapide
+except ImportError:
+    zstandard = None
 
 DATA_DIR = Path("pf2_data")
 RAW_DIR = DATA_DIR / "raw"
 DB_FILE = DATA_DIR / "pf2e_v5.db"  # Même nom pour compatibilité avec search
+PARSE_WORKERS = os.cpu_count() or 1  # Processus pour le parsing des fichiers .htm
+READ_THREADS = 16  # Threads de lecture des fichiers JSON Foundry (E/S, GIL relâché)
 
+# (nom, url, dossiers utiles pour le sparse-checkout)
 REPOS = [
-    ("pf2e", "https://github.com/foundryvtt/pf2e.git"),
-    ("pf2-fr", "https://gitlab.com/pathfinder-fr/foundryvtt-pathfinder2-fr.git"),
+    ("pf2e", "https://github.com/foundryvtt/pf2e.git", ["packs", "static/lang"]),
+    ("pf2-fr", "https://gitlab.com/pathfinder-fr/foundryvtt-pathfinder2-fr.git", ["data", "lang"]),
 ]
 
 # ============================================================================
@@ -53,18 +85,46 @@ if not sys.stdout.isatty():
     for attr in ['RESET', 'BOLD', 'DIM', 'RED', 'GREEN', 'YELLOW', 'CYAN']:
         setattr(C, attr, '')
 
+# Préfixe (couleur + icône) de chaque niveau, calculé une fois après la
+# détection du terminal ci-dessus
+LOG_PREFIXES = {
+    "info": f"{C.CYAN}→ ", "ok": f"{C.GREEN}✓ ", "warn": f"{C.YELLOW}⚠ ",
+    "err": f"{C.RED}✗ ", "dim": f"{C.DIM}  ",
+}
+
 def log(msg: str, level: str = "info"):
-    colors = {"info": C.CYAN, "ok": C.GREEN, "warn": C.YELLOW, "err": C.RED, "dim": C.DIM}
-    icons = {"info": "→", "ok": "✓", "warn": "⚠", "err": "✗", "dim": " "}
-    print(f"{colors.get(level, '')}{icons.get(level, '')} {msg}{C.RESET}")
+    sys.stdout.write(f"{LOG_PREFIXES.get(level, ' ')}{msg}{C.RESET}\n")
 
-def run_cmd(cmd: list, cwd: Path = None, timeout: int = 900) -> Tuple[bool, str]:
+def run_cmd(cmd: list, cwd: Path = None, timeout: int = 900, quiet: bool = False) -> Tuple[bool, str]:
+    """Lance une commande. quiet: stdout jeté, seul stderr est récupéré."""
     try:
+        if quiet:
+            r = subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, timeout=timeout)
+            return r.returncode == 0, r.stderr
         r = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout)
         return r.returncode == 0, r.stdout + r.stderr
     except Exception as e:
         return False, str(e)
 
+def iter_files(root, ext: str, depth: Optional[int] = None, skip_prefix: str = "") -> Iterator[str]:
+    """Produit les chemins (str) des fichiers *ext sous root, via os.scandir.
+    
+    Les fichiers d'un dossier passent avant ceux de ses sous-dossiers.
+    depth limite le nombre de niveaux de sous-dossiers (None = illimité).
+    Les fichiers dont le nom commence par skip_prefix sont ignorés.
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif e.name.endswith(ext) and not (skip_prefix and e.name.startswith(skip_prefix)):
+                yield e.path
+    if depth is None or depth > 0:
+        for d in subdirs:
+            yield from iter_files(d, ext, None if depth is None else depth - 1, skip_prefix)
+
 # ============================================================================
 # MAPPING DES TYPES
 # ============================================================================
@@ -92,12 +152,22 @@ PACK_TYPE_MAP = {
     "vehicles": "véhicule", "animal-companions": "compagnon", "eidolons": "eidolon",
 }
 
+# Libellés partagés par des milliers d'entrées: une seule instance de chaque
+TYPE_MAP = {k: sys.intern(v) for k, v in TYPE_MAP.items()}
+PACK_TYPE_MAP = {k: sys.intern(v) for k, v in PACK_TYPE_MAP.items()}
+
+# Clés triées de la plus longue à la plus courte: la correspondance la plus
+# spécifique l'emporte, indépendamment de l'ordre de déclaration ci-dessus
+PACK_TYPE_KEYS = tuple(sorted(PACK_TYPE_MAP, key=len, reverse=True))
+
 def detect_type_from_entry(entry: dict) -> str:
-    t = entry.get("type", "")
-    if t in TYPE_MAP:
-        return TYPE_MAP[t]
+    mapped = TYPE_MAP.get(entry.get("type", ""))
+    if mapped:
+        return mapped
+    # Repli sur quelques clés de system (tests d'appartenance, rien à mémoriser)
     system = entry.get("system", {})
-    if "attributes" in system and "hp" in system.get("attributes", {}):
+    attributes = system.get("attributes")
+    if attributes and "hp" in attributes:
         return "créature"
     if "traditions" in system:
         return "sort"
@@ -107,17 +177,89 @@ def detect_type_from_entry(entry: dict) -> str:
         return "équipement"
     return "autre"
 
+@lru_cache(maxsize=None)  # Quelques dizaines de packs pour des milliers d'entrées
 def detect_type_from_pack(pack_name: str) -> str:
     pack_lower = pack_name.lower().replace(".json", "").replace("-srd", "")
-    for key, val in PACK_TYPE_MAP.items():
+    for key in PACK_TYPE_KEYS:
         if key in pack_lower:
-            return val
+            return PACK_TYPE_MAP[key]
     return "autre"
 
 # ============================================================================
 # TÉLÉCHARGEMENT
 # ============================================================================
 
+def clone_repo(name: str, url: str, paths: List[str]) -> bool:
+    """Clone un dépôt (partiel si possible, complet sinon)."""
+    target = RAW_DIR / name
+    log(f"Clonage {name}...", "info")
+    # Sans historique ni blobs hors des dossiers utiles
+    ok, _ = run_cmd(["git", "clone", "-q", "--depth", "1", "--filter=blob:none", "--sparse", url, str(target)],
+                    quiet=True)
+    if ok:
+        ok, _ = run_cmd(["git", "-C", str(target), "sparse-checkout", "set", *paths], quiet=True)
+    if not ok:
+        # Git trop ancien ou serveur sans filtre: clone superficiel, sans historique
+        if target.exists():
+            shutil.rmtree(target)
+        ok, _ = run_cmd(["git", "clone", "-q", "--depth", "1", url, str(target)], quiet=True)
+    if not ok:
+        # Serveur sans clone superficiel: clone complet
+        if target.exists():
+            shutil.rmtree(target)
+        ok, _ = run_cmd(["git", "clone", "-q", url, str(target)], quiet=True)
+    log(f"  {name}: {'OK' if ok else 'ÉCHEC'}", "ok" if ok else "err")
+    return ok
+
+
+def fetch_latest(target: Path) -> bool:
+    """Ramène un clone existant sur le dernier commit distant."""
+    # Seul le dernier commit compte: le clone reste superficiel
+    ok, _ = run_cmd(["git", "-C", str(target), "fetch", "-q", "--depth", "1", "origin"], quiet=True)
+    if ok:
+        ok, _ = run_cmd(["git", "-C", str(target), "reset", "-q", "--hard", "FETCH_HEAD"], quiet=True)
+    return ok
+
+
+def repair_or_reclone(name: str, url: str, paths: List[str]) -> bool:
+    """Remet en état un clone dont la mise à jour a échoué.
+    
+    Le dossier n'est supprimé et re-cloné que si le dépôt est corrompu;
+    sinon on nettoie la copie de travail et on retente la mise à jour.
+    """
+    target = RAW_DIR / name
+    git = ["git", "-C", str(target)]
+    ok, _ = run_cmd(git + ["fsck", "--no-progress", "--connectivity-only"], quiet=True)
+    if not ok:
+        log(f"  {name}: dépôt corrompu, nouveau clone", "warn")
+        shutil.rmtree(target)
+        return clone_repo(name, url, paths)
+    
+    run_cmd(git + ["remote", "prune", "origin"], quiet=True)
+    run_cmd(git + ["reset", "-q", "--hard"], quiet=True)
+    run_cmd(git + ["clean", "-q", "-fdx"], quiet=True)
+    if fetch_latest(target):
+        run_cmd(git + ["gc", "--auto", "--quiet"], quiet=True)
+        log(f"  {name}: réparé et à jour", "ok")
+    else:
+        # Réseau indisponible: la copie locale reste utilisable
+        log(f"  {name}: mise à jour impossible, copie locale conservée", "warn")
+    return True
+
+
+def sync_repo(name: str, url: str, paths: List[str]) -> bool:
+    """Met à jour ou clone un dépôt (clone partiel limité aux dossiers utiles)."""
+    target = RAW_DIR / name
+    if not target.exists():
+        return clone_repo(name, url, paths)
+    
+    log(f"Mise à jour {name}...", "dim")
+    if fetch_latest(target):
+        log(f"  {name}: à jour", "ok")
+        return True
+    return repair_or_reclone(name, url, paths)
+
+
 def download_repos() -> Dict[str, bool]:
     RAW_DIR.mkdir(parents=True, exist_ok=True)
     ok, _ = run_cmd(["git", "--version"])
@@ -125,55 +267,199 @@ def download_repos() -> Dict[str, bool]:
         log("Git non installé!", "err")
         return {}
     
+    # Limité par le réseau et le disque: les dépôts se téléchargent en parallèle
     results = {}
-    for name, url in REPOS:
-        target = RAW_DIR / name
-        if target.exists():
-            log(f"Mise à jour {name}...", "dim")
-            ok, _ = run_cmd(["git", "-C", str(target), "pull", "--ff-only"])
-            if ok:
-                results[name] = True
-                log(f"  {name}: à jour", "ok")
-                continue
-            shutil.rmtree(target)
-        
-        log(f"Clonage {name}...", "info")
-        ok, out = run_cmd(["git", "clone", "--depth", "1", url, str(target)])
-        if not ok:
-            ok, out = run_cmd(["git", "clone", url, str(target)])
-        results[name] = ok
-        log(f"  {name}: {'OK' if ok else 'ÉCHEC'}", "ok" if ok else "err")
+    with ThreadPoolExecutor(max_workers=len(REPOS)) as ex:
+        futures = {ex.submit(sync_repo, name, url, paths): name for name, url, paths in REPOS}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
     return results
 
 # ============================================================================
 # PARSING DES FICHIERS .HTM (TRADUCTIONS)
 # ============================================================================
 
-@dataclass
+# __slots__ (Python 3.10+): pas de __dict__ par instance, des dizaines de
+# milliers de traductions et d'items restent en mémoire pendant l'extraction
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Seuls les champs lus par apply_translation sont gardés: la description EN
+# ne sert que de repli, déjà appliqué à desc_fr au parsing
+
+@dataclass(**DATACLASS_SLOTS)
 class ItemTranslation:
     id: str
     name_en: str
     name_fr: str
-    desc_en: str = ""
     desc_fr: str = ""
 
-@dataclass 
+@dataclass(**DATACLASS_SLOTS)
 class Translation:
     uuid: str
     pack: str
     name_en: str
     name_fr: str
-    desc_en: str = ""
     desc_fr: str = ""
     status: str = ""
-    items: Dict[str, ItemTranslation] = field(default_factory=dict)
+    # None quand le fichier n'a pas d'items (la majorité): pas de dict vide
+    items: Optional[Dict[str, ItemTranslation]] = None
+
+
+# Marqueurs de sections des fichiers .htm (texte brut, pas du HTML structuré)
+DESC_EN_MARKER = "-- Desc (en) --"
+DESC_FR_MARKER = "-- Desc (fr) --"
+END_DESC_MARKER = "-- End desc ---"
+DESC_EN_END_MARKERS = (DESC_FR_MARKER, END_DESC_MARKER)
+DESC_FR_END_MARKERS = (END_DESC_MARKER,)
+ITEMS_END_MARKER = "-" * 10  # Ligne de séparation après la section Items
+# Mêmes marqueurs en octets (ASCII), pour chercher sans décoder le fichier
+DESC_FR_MARKER_BYTES = DESC_FR_MARKER.encode("ascii")
+DESC_FR_END_MARKERS_BYTES = tuple(m.encode("ascii") for m in DESC_FR_END_MARKERS)
+
+# Champs "Clé: valeur" en début de ligne
+NAME_EN_KEY = "Name:"
+NAME_FR_KEY = "Nom:"
+STATUS_KEY = "État:"
+ITEM_ID_KEY = "ID:"
+HEADER_KEYS = (NAME_EN_KEY, NAME_FR_KEY, STATUS_KEY)
+ITEM_KEYS = (ITEM_ID_KEY, NAME_EN_KEY, NAME_FR_KEY)
+JOURNAL_KEYS = (NAME_EN_KEY, NAME_FR_KEY)
+
+# Expressions compilées une fois pour toutes (appelées pour chaque fichier)
+ITEMS_HEADER_PREFIX = "----- Items -"
+RE_ITEMS_HEADER = re.compile(r'----- Items -+\s*')
+# Un UUID Foundry est généralement 16 caractères alphanumériques
+RE_UUID = re.compile(r'[A-Za-z0-9]{16}')
+# Format: @UUID[Compendium.pf2e.journals.JournalEntry.XXX.JournalEntryPage.YYY]{...}
+JOURNAL_REF_PREFIX = "@UUID[Compendium.pf2e.journals.JournalEntry."
+RE_JOURNAL_REF = re.compile(r'@UUID\[Compendium\.pf2e\.journals\.JournalEntry\.[^.]+\.JournalEntryPage\.([^\]]+)\]')
+
+
+def parse_fields(content: str, keys: Tuple[str, ...], start: int = 0, stop: Optional[int] = None) -> Dict[str, str]:
+    """Valeurs des premières lignes "Clé: valeur" pour chaque clé, en une passe.
+    
+    S'arrête dès que toutes les clés sont trouvées (en-tête en début de fichier).
+    start/stop limitent la recherche à content[start:stop] sans le copier.
+    """
+    found = {}
+    pos = start
+    size = len(content) if stop is None else stop
+    while pos < size and len(found) < len(keys):
+        end = content.find("\n", pos, size)
+        if end < 0:
+            end = size
+        for key in keys:
+            if key not in found and content.startswith(key, pos, end):
+                found[key] = content[pos + len(key):end].strip()
+                break
+        pos = end + 1
+    return found
+
 
+def find_section(content: str, start_marker: str, end_markers: Tuple[str, ...],
+                 start: int = 0, stop: Optional[int] = None) -> str:
+    """Retourne le texte entre start_marker et le premier end_marker (ou la fin).
+    
+    start/stop limitent la recherche à content[start:stop] sans le copier.
+    Fonctionne aussi sur des bytes avec des marqueurs bytes.
+    """
+    end = len(content) if stop is None else stop
+    start = content.find(start_marker, start, end)
+    if start < 0:
+        return ""
+    start += len(start_marker)
+    for marker in end_markers:
+        pos = content.find(marker, start, end)
+        if pos >= 0:
+            end = pos
+    return content[start:end].strip()
 
-def parse_htm_file(filepath: Path, pack_name: str) -> Optional[Translation]:
+
+def item_blocks(content: str) -> Iterator[Tuple[int, int]]:
+    """Bornes (début, fin) de chaque bloc "ID:" de la section Items.
+    
+    Les bornes s'appliquent directement à content: ni la section ni les
+    blocs ne sont copiés.
+    """
+    # La plupart des fichiers n'ont pas d'items: str.find avant la regex
+    idx = content.find(ITEMS_HEADER_PREFIX)
+    if idx < 0:
+        return
+    header = RE_ITEMS_HEADER.search(content, idx)
+    if not header:
+        return
+    start = header.end()
+    # La section s'arrête à la prochaine ligne de tirets (ou à la fin)
+    end = content.find(ITEMS_END_MARKER, start + 1)
+    if end < 0:
+        end = len(content)
+    
+    marker = "\n" + ITEM_ID_KEY
+    if content.startswith(ITEM_ID_KEY, start, end):
+        pos = start
+    else:
+        pos = content.find(marker, start, end)
+        if pos < 0:
+            return
+        pos += 1
+    while True:
+        next_pos = content.find(marker, pos, end)
+        if next_pos < 0:
+            yield pos, end
+            return
+        yield pos, next_pos
+        pos = next_pos + 1
+
+
+# Erreurs attendues à la lecture d'un fichier : I/O ou encodage invalide
+READ_ERRORS = (OSError, UnicodeDecodeError)
+
+
+def read_htm_bytes(filepath: str) -> bytes:
+    """Lit un fichier .htm en un seul read() non bufferisé, sans décoder."""
+    # Ni TextIOWrapper ni BufferedReader par fichier
+    with open(filepath, "rb", buffering=0) as f:
+        return f.read()
+
+
+# Au-delà de cette taille, les pages de journaux sont projetées en mémoire
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def read_htm_section(filepath: str, start_marker: bytes, end_markers: Tuple[bytes, ...]) -> bytes:
+    """Octets d'une section d'un fichier .htm, sans copier le reste du fichier.
+    
+    Les gros fichiers passent par mmap: seule la section trouvée est copiée.
+    """
+    with open(filepath, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return find_section(f.read(), start_marker, end_markers)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return find_section(data, start_marker, end_markers)
+
+
+def decode_htm(raw: bytes) -> str:
+    """Décode en UTF-8 avec les mêmes fins de ligne qu'une lecture en mode texte."""
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def read_htm(filepath: str) -> str:
+    """Lit et décode un fichier .htm entier."""
+    return decode_htm(read_htm_bytes(filepath))
+
+
+def file_stem(filepath: str) -> str:
+    return os.path.splitext(os.path.basename(filepath))[0]
+
+
+def parse_htm_file(filepath: str, pack_name: str) -> Optional[Translation]:
     """Parse un fichier .htm de traduction."""
     try:
-        content = filepath.read_text(encoding="utf-8")
-    except:
+        content = read_htm(filepath)
+    except READ_ERRORS:
         return None
     
     # Extraire l'UUID depuis le nom de fichier
@@ -182,91 +468,44 @@ def parse_htm_file(filepath: Path, pack_name: str) -> Optional[Translation]:
     # - {rarity}-{level}-{UUID}.htm (ex: common-03-sxQZ6yqTn0czJxVd.htm)
     # - {type}-{level}-{UUID}.htm (ex: equipment-00-oJZe5rRitvioUgRh.htm)
     # - {prefix}-{UUID}.htm (ex: backpack-12-iAfqKpHyJ6beLGjB.htm)
-    stem = filepath.stem
-    parts = stem.split("-")
-    
-    # Un UUID Foundry est généralement 16 caractères alphanumériques
-    def looks_like_uuid(s: str) -> bool:
-        return len(s) == 16 and s.isalnum()
-    
-    if len(parts) >= 2 and looks_like_uuid(parts[-1]):
-        # Le dernier segment ressemble à un UUID
-        uuid = parts[-1]
-    elif len(parts) == 1 and looks_like_uuid(parts[0]):
-        # Juste un UUID
-        uuid = parts[0]
-    else:
-        # Fallback: prendre tout le nom (cas rares)
-        uuid = stem
-    
-    # Parser les champs principaux
-    name_en = ""
-    name_fr = ""
-    desc_en = ""
-    desc_fr = ""
-    status = ""
-    
-    # Name: / Nom:
-    match = re.search(r'^Name:\s*(.+)$', content, re.MULTILINE)
-    if match:
-        name_en = match.group(1).strip()
+    stem = file_stem(filepath)
     
-    match = re.search(r'^Nom:\s*(.+)$', content, re.MULTILINE)
-    if match:
-        name_fr = match.group(1).strip()
+    # Le dernier segment (ou le nom entier, sans tiret) s'il ressemble à un
+    # UUID; sinon fallback: prendre tout le nom (cas rares)
+    last = stem.rpartition("-")[2]
+    uuid = last if RE_UUID.fullmatch(last) else stem
     
-    match = re.search(r'^État:\s*(.+)$', content, re.MULTILINE)
-    if match:
-        status = match.group(1).strip()
+    # Parser les champs principaux: Name: / Nom: / État:
+    fields = parse_fields(content, HEADER_KEYS)
+    name_en = fields.get(NAME_EN_KEY, "")
+    name_fr = fields.get(NAME_FR_KEY, "")
+    status = fields.get(STATUS_KEY, "")
     
     # Descriptions
     # -- Desc (en) -- ... -- Desc (fr) -- ou -- End desc ---
-    desc_en_match = re.search(r'-- Desc \(en\) --\s*(.+?)(?=-- Desc \(fr\) --|-- End desc ---|$)', content, re.DOTALL)
-    if desc_en_match:
-        desc_en = desc_en_match.group(1).strip()
-    
-    desc_fr_match = re.search(r'-- Desc \(fr\) --\s*(.+?)(?=-- End desc ---|$)', content, re.DOTALL)
-    if desc_fr_match:
-        desc_fr = desc_fr_match.group(1).strip()
+    desc_en = find_section(content, DESC_EN_MARKER, DESC_EN_END_MARKERS)
+    desc_fr = find_section(content, DESC_FR_MARKER, DESC_FR_END_MARKERS)
     
     # Parser les items
     items = {}
-    items_section = re.search(r'----- Items -+\s*(.+?)(?=-{10,}|$)', content, re.DOTALL)
-    if items_section:
-        items_content = items_section.group(1)
+    # Chercher chaque bloc ID: / Name: / Nom: (bornes dans content, sans copie)
+    for block_start, block_end in item_blocks(content):
+        item_fields = parse_fields(content, ITEM_KEYS, block_start, block_end)
+        item_id = item_fields.get(ITEM_ID_KEY, "")
         
-        # Chercher chaque bloc ID: / Name: / Nom:
-        item_blocks = re.split(r'(?=^ID:\s)', items_content, flags=re.MULTILINE)
-        for block in item_blocks:
-            if not block.strip():
-                continue
+        if item_id:
+            item_name_en = item_fields.get(NAME_EN_KEY, "")
+            item_name_fr = item_fields.get(NAME_FR_KEY, item_name_en)
             
-            item_id_match = re.search(r'^ID:\s*(.+)$', block, re.MULTILINE)
-            item_name_en_match = re.search(r'^Name:\s*(.+)$', block, re.MULTILINE)
-            item_name_fr_match = re.search(r'^Nom:\s*(.+)$', block, re.MULTILINE)
+            # Description de l'item
+            item_desc_fr = find_section(content, DESC_FR_MARKER, DESC_FR_END_MARKERS, block_start, block_end)
             
-            if item_id_match:
-                item_id = item_id_match.group(1).strip()
-                item_name_en = item_name_en_match.group(1).strip() if item_name_en_match else ""
-                item_name_fr = item_name_fr_match.group(1).strip() if item_name_fr_match else item_name_en
-                
-                # Description de l'item
-                item_desc_en = ""
-                item_desc_fr = ""
-                item_desc_en_match = re.search(r'-- Desc \(en\) --\s*(.+?)(?=-- Desc \(fr\) --|-- End desc ---|^ID:|$)', block, re.DOTALL)
-                if item_desc_en_match:
-                    item_desc_en = item_desc_en_match.group(1).strip()
-                item_desc_fr_match = re.search(r'-- Desc \(fr\) --\s*(.+?)(?=-- End desc ---|^ID:|$)', block, re.DOTALL)
-                if item_desc_fr_match:
-                    item_desc_fr = item_desc_fr_match.group(1).strip()
-                
-                items[item_id] = ItemTranslation(
-                    id=item_id,
-                    name_en=item_name_en,
-                    name_fr=item_name_fr,
-                    desc_en=item_desc_en,
-                    desc_fr=item_desc_fr
-                )
+            items[item_id] = ItemTranslation(
+                id=item_id,
+                name_en=item_name_en,
+                name_fr=item_name_fr,
+                desc_fr=item_desc_fr
+            )
     
     if not name_en and not name_fr:
         return None
@@ -276,13 +515,32 @@ def parse_htm_file(filepath: Path, pack_name: str) -> Optional[Translation]:
         pack=pack_name,
         name_en=name_en,
         name_fr=name_fr or name_en,
-        desc_en=desc_en,
         desc_fr=desc_fr or desc_en,
         status=status,
-        items=items
+        items=items or None
     )
 
 
+def parse_journal_page(htm_file: str) -> Optional[Tuple[str, str]]:
+    """Retourne (UUID de la page, description FR) ou None."""
+    try:
+        # Marqueurs ASCII: recherche sur les octets, seule la description est décodée
+        raw = read_htm_section(htm_file, DESC_FR_MARKER_BYTES, DESC_FR_END_MARKERS_BYTES)
+        desc_fr = decode_htm(raw).strip()
+    except READ_ERRORS:
+        return None
+    
+    if not desc_fr:
+        return None
+    return file_stem(htm_file), desc_fr
+
+
+def journal_page_dirs(data_dir: Path) -> List[Tuple[str, str]]:
+    """(nom, chemin) des sous-dossiers pages-* (d_type de scandir, sans stat)."""
+    with os.scandir(data_dir) as it:
+        return [(e.name, e.path) for e in it if e.name.startswith("pages-") and e.is_dir()]
+
+
 def load_journal_pages() -> Dict[str, str]:
     """Charge les pages de journaux (descriptions complètes des classes, etc.)."""
     journals = {}  # Clé = UUID de la page, Valeur = description FR
@@ -292,113 +550,178 @@ def load_journal_pages() -> Dict[str, str]:
         return journals
     
     # Parcourir les sous-dossiers pages-*
-    for subdir in data_dir.iterdir():
-        if subdir.is_dir() and subdir.name.startswith("pages-"):
-            for htm_file in subdir.glob("*.htm"):
-                try:
-                    content = htm_file.read_text(encoding="utf-8")
-                    uuid = htm_file.stem
-                    
-                    # Extraire la description FR
-                    desc_fr_match = re.search(r'-- Desc \(fr\) --\s*(.+?)(?=-- End desc ---|$)', content, re.DOTALL)
-                    if desc_fr_match:
-                        journals[uuid] = desc_fr_match.group(1).strip()
-                except:
-                    pass
+    htm_files = []
+    for _, subdir in journal_page_dirs(data_dir):
+        htm_files.extend(iter_files(subdir, ".htm", depth=0))
+    
+    # Même répartition que les traductions; map() conserve l'ordre des fichiers
+    with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as ex:
+        for page in ex.map(parse_journal_page, htm_files, chunksize=64):
+            if page:
+                uuid, desc_fr = page
+                journals[uuid] = desc_fr
     
     return journals
 
 
-def extract_journal_entries() -> List[dict]:
+# Mapping des dossiers de journaux vers les types
+JOURNAL_FOLDER_TYPES = {
+    "pages-GMScreen": "règle",
+    "pages-Classes": "classe",
+    "pages-Ancestries": "ascendance", 
+    "pages-Archetypes": "archétype",
+    "pages-Domains": "domaine",
+    "pages-RemasterChanges": "règle",
+}
+
+
+# Champs à valeurs répétées d'une page de journal à l'autre
+JOURNAL_SHARED_KEYS = ("_pack", "_pack_type", "_source", "type")
+
+
+def parse_journal_entry(htm_file: str, pack_name: str, entry_type: str) -> Optional[dict]:
+    """Construit l'entrée recherchable d'une page de journal (None si sans nom)."""
+    try:
+        content = read_htm(htm_file)
+    except READ_ERRORS:
+        return None
+    
+    uuid = file_stem(htm_file)
+    
+    # Parser les champs
+    fields = parse_fields(content, JOURNAL_KEYS)
+    name_en = fields.get(NAME_EN_KEY, "")
+    name_fr = fields.get(NAME_FR_KEY, "")
+    
+    # Description
+    desc_en = find_section(content, DESC_EN_MARKER, DESC_EN_END_MARKERS)
+    desc_fr = find_section(content, DESC_FR_MARKER, DESC_FR_END_MARKERS)
+    
+    if not name_fr and not name_en:
+        return None
+    
+    # Créer l'entrée
+    return {
+        "_id": uuid,
+        "_pack": f"journals-{pack_name}",
+        "_pack_type": entry_type,
+        "_source": "pf2-fr",
+        "_translated": True,
+        "name": name_fr or name_en,
+        "name_fr": name_fr or name_en,
+        "name_en": name_en or name_fr,
+        "description_fr": desc_fr,
+        "type": "journal",
+        "system": {
+            "description": {"value": desc_en or desc_fr}
+        }
+    }
+
+
+def extract_journal_entries() -> Iterator[dict]:
     """Extrait les pages de journaux comme entrées recherchables."""
-    entries = []
+    count = 0
     
     data_dir = RAW_DIR / "pf2-fr" / "data" / "journals"
     if not data_dir.exists():
-        return entries
-    
-    # Mapping des dossiers vers les types
-    folder_type_map = {
-        "pages-GMScreen": "règle",
-        "pages-Classes": "classe",
-        "pages-Ancestries": "ascendance", 
-        "pages-Archetypes": "archétype",
-        "pages-Domains": "domaine",
-        "pages-RemasterChanges": "règle",
-    }
+        return
     
     log("Extraction des journaux (règles, etc.)...", "info")
-    count = 0
     
     # Parcourir les sous-dossiers pages-*
-    for subdir in data_dir.iterdir():
-        if not subdir.is_dir() or not subdir.name.startswith("pages-"):
-            continue
-        
-        entry_type = folder_type_map.get(subdir.name, "règle")
-        pack_name = subdir.name.replace("pages-", "").lower()
+    htm_files = []
+    pack_names = []
+    entry_types = []
+    for subdir_name, subdir in journal_page_dirs(data_dir):
+        entry_type = JOURNAL_FOLDER_TYPES.get(subdir_name, "règle")
+        pack_name = subdir_name.replace("pages-", "").lower()
         
-        for htm_file in subdir.glob("*.htm"):
-            try:
-                content = htm_file.read_text(encoding="utf-8")
-                uuid = htm_file.stem
-                
-                # Parser les champs
-                name_en = ""
-                name_fr = ""
-                desc_en = ""
-                desc_fr = ""
-                
-                match = re.search(r'^Name:\s*(.+)$', content, re.MULTILINE)
-                if match:
-                    name_en = match.group(1).strip()
-                
-                match = re.search(r'^Nom:\s*(.+)$', content, re.MULTILINE)
-                if match:
-                    name_fr = match.group(1).strip()
-                
-                # Description
-                desc_en_match = re.search(r'-- Desc \(en\) --\s*(.+?)(?=-- Desc \(fr\) --|-- End desc ---|$)', content, re.DOTALL)
-                if desc_en_match:
-                    desc_en = desc_en_match.group(1).strip()
-                
-                desc_fr_match = re.search(r'-- Desc \(fr\) --\s*(.+?)(?=-- End desc ---|$)', content, re.DOTALL)
-                if desc_fr_match:
-                    desc_fr = desc_fr_match.group(1).strip()
-                
-                if not name_fr and not name_en:
-                    continue
-                
-                # Créer l'entrée
-                entry = {
-                    "_id": uuid,
-                    "_pack": f"journals-{pack_name}",
-                    "_pack_type": entry_type,
-                    "_source": "pf2-fr",
-                    "_translated": True,
-                    "name": name_fr or name_en,
-                    "name_fr": name_fr or name_en,
-                    "name_en": name_en or name_fr,
-                    "description_fr": desc_fr,
-                    "type": "journal",
-                    "system": {
-                        "description": {"value": desc_en or desc_fr}
-                    }
-                }
-                
-                entries.append(entry)
+        pages = list(iter_files(subdir, ".htm", depth=0))
+        htm_files.extend(pages)
+        pack_names.extend([pack_name] * len(pages))
+        entry_types.extend([entry_type] * len(pages))
+    
+    with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as ex:
+        for entry in ex.map(parse_journal_entry, htm_files, pack_names, entry_types, chunksize=64):
+            if entry:
+                # Une seule instance par valeur au lieu d'une copie par page
+                for key in JOURNAL_SHARED_KEYS:
+                    entry[key] = sys.intern(entry[key])
                 count += 1
-                
-            except Exception as e:
-                pass
+                yield entry
     
     log(f"  {count} pages de journaux extraites", "ok")
-    return entries
 
 
-def extract_traits() -> List[dict]:
+@lru_cache(maxsize=None)  # fr.json / en.json partagés par les cinq extracteurs suivants
+def load_lang(path: Path) -> dict:
+    """Charge un fichier de langue une seule fois (dict partagé, ne pas modifier)."""
+    return json_loads(path.read_bytes())
+
+
+# Catégories simples du glossaire: préfixe de clé PF2E -> (préfixe d'id, libellé)
+GLOSSARY_CATEGORIES = {
+    "ActorSize": ("taille", "Taille"),
+    "ProficiencyLevel": ("maîtrise", "Niveau de maîtrise"),
+    "DCAdjustment": ("dd", "Ajustement DD"),
+    "ActionType": ("type-action", "Type d'action"),
+    "PreparationType": ("préparation", "Type de préparation"),
+    "WeaponGroup": ("groupe-arme", "Groupe d'armes"),
+    "ArmorGroup": ("groupe-armure", "Groupe d'armures"),
+    "WeaponType": ("type-arme", "Type d'arme"),
+    "ArmorType": ("type-armure", "Type d'armure"),
+    "Currency": ("devise", "Devise"),
+}
+
+# Préfixes des clés PF2E.* lues par les extracteurs de langue
+LANG_PREFIXES = ("TraitDescription", "Trait", "AttackEffect", "ConditionType",
+                 "PreciousMaterial") + tuple(GLOSSARY_CATEGORIES)
+# Le plus long d'abord: "TraitDescriptionX" ne doit pas tomber dans "Trait"
+RE_LANG_PREFIX = re.compile("|".join(sorted(LANG_PREFIXES, key=len, reverse=True)))
+
+
+@lru_cache(maxsize=None)
+def lang_prefix_index(path: Path) -> Dict[str, List[Tuple[str, str]]]:
+    """Clés PF2E.<préfixe><suffixe> à valeur texte, regroupées par préfixe en une passe.
+    
+    Chaque extracteur parcourt ensuite sa liste de (suffixe, valeur) au lieu
+    de tout le dictionnaire PF2E.
+    """
+    index = {prefix: [] for prefix in LANG_PREFIXES}
+    for key, value in load_lang(path).get("PF2E", {}).items():
+        if isinstance(value, str):
+            match = RE_LANG_PREFIX.match(key)
+            if match:
+                index[match.group()].append((key[match.end():], value))
+    return index
+
+
+def lang_entry(entry_id: str, pack: str, entry_type: str, name_fr: str, name_en: str,
+               desc_fr: str, desc_en: str, translated: bool, category: Optional[str] = None) -> dict:
+    """Entrée issue des fichiers de langue (même structure pour tous les extracteurs)."""
+    entry = {
+        "_id": entry_id,
+        "_pack": pack,
+        "_pack_type": entry_type,
+        "_source": "pf2-fr+pf2e",
+        "_translated": translated,
+        "name": name_fr or name_en,
+        "name_fr": name_fr or name_en,
+        "name_en": name_en or name_fr,
+        "description_fr": desc_fr,
+        "type": entry_type,
+    }
+    if category:
+        entry["glossary_category"] = category
+    entry["system"] = {
+        "description": {"value": desc_en or desc_fr}
+    }
+    return entry
+
+
+def extract_traits() -> Iterator[dict]:
     """Extrait les traits depuis les fichiers de langue."""
-    entries = []
+    count = 0
     
     # Chemins des fichiers de langue
     fr_file = RAW_DIR / "pf2-fr" / "lang" / "fr.json"
@@ -406,63 +729,43 @@ def extract_traits() -> List[dict]:
     
     if not fr_file.exists():
         log(f"Fichier de langue FR non trouvé: {fr_file}", "warn")
-        return entries
+        return
     
     if not en_file.exists():
         log(f"Fichier de langue EN non trouvé: {en_file}", "warn")
-        return entries
+        return
     
     log("Extraction des traits depuis les fichiers de langue...", "info")
     
-    # Charger les fichiers JSON
+    # Charger les fichiers JSON (indexés par préfixe en une passe)
     try:
-        with open(fr_file, 'r', encoding='utf-8') as f:
-            fr_data = json.load(f)
-        with open(en_file, 'r', encoding='utf-8') as f:
-            en_data = json.load(f)
+        fr_index = lang_prefix_index(fr_file)
+        en_index = lang_prefix_index(en_file)
     except Exception as e:
         log(f"Erreur chargement fichiers de langue: {e}", "err")
-        return entries
+        return
     
-    # Extraire les traits FR (dans PF2E.TraitDescriptionXxx)
+    # Extraire les traits FR et EN (dans PF2E.TraitDescriptionXxx)
     fr_traits = {}
-    if "PF2E" in fr_data:
-        for key, value in fr_data["PF2E"].items():
-            if key.startswith("TraitDescription") and isinstance(value, str):
-                trait_name = key[len("TraitDescription"):]  # Enlever le préfixe
-                fr_traits[trait_name.lower()] = {
-                    "name": trait_name,
-                    "description": value
-                }
-    
-    # Extraire les traits EN (dans PF2E.TraitDescriptionXxx)
+    for trait_name, value in fr_index["TraitDescription"]:
+        fr_traits[trait_name.lower()] = {
+            "name": trait_name,
+            "description": value
+        }
+    
     en_traits = {}
-    if "PF2E" in en_data:
-        for key, value in en_data["PF2E"].items():
-            if key.startswith("TraitDescription") and isinstance(value, str):
-                trait_name = key[len("TraitDescription"):]
-                en_traits[trait_name.lower()] = {
-                    "name": trait_name,
-                    "description": value
-                }
+    for trait_name, value in en_index["TraitDescription"]:
+        en_traits[trait_name.lower()] = {
+            "name": trait_name,
+            "description": value
+        }
     
     # Aussi chercher les labels des traits (TraitXxx pour le nom affiché)
-    fr_labels = {}
-    en_labels = {}
-    if "PF2E" in fr_data:
-        for key, value in fr_data["PF2E"].items():
-            if key.startswith("Trait") and not key.startswith("TraitDescription") and isinstance(value, str):
-                trait_key = key[len("Trait"):].lower()
-                fr_labels[trait_key] = value
-    
-    if "PF2E" in en_data:
-        for key, value in en_data["PF2E"].items():
-            if key.startswith("Trait") and not key.startswith("TraitDescription") and isinstance(value, str):
-                trait_key = key[len("Trait"):].lower()
-                en_labels[trait_key] = value
+    fr_labels = {trait_key.lower(): value for trait_key, value in fr_index["Trait"]}
+    en_labels = {trait_key.lower(): value for trait_key, value in en_index["Trait"]}
     
     # Combiner FR et EN
-    all_trait_keys = set(fr_traits.keys()) | set(en_traits.keys())
+    all_trait_keys = fr_traits.keys() | en_traits.keys()
     
     for trait_key in all_trait_keys:
         fr_info = fr_traits.get(trait_key, {})
@@ -475,67 +778,44 @@ def extract_traits() -> List[dict]:
         desc_fr = fr_info.get("description", "")
         desc_en = en_info.get("description", "")
         
-        entry = {
-            "_id": trait_key,
-            "_pack": "traits",
-            "_pack_type": "trait",
-            "_source": "pf2-fr+pf2e",
-            "_translated": bool(desc_fr),
-            "name": name_fr or name_en,
-            "name_fr": name_fr or name_en,
-            "name_en": name_en or name_fr,
-            "description_fr": desc_fr,
-            "type": "trait",
-            "system": {
-                "description": {"value": desc_en or desc_fr}
-            }
-        }
-        
-        entries.append(entry)
+        count += 1
+        yield lang_entry(trait_key, "traits", "trait", name_fr, name_en,
+                         desc_fr, desc_en, bool(desc_fr))
     
-    log(f"  {len(entries)} traits extraits", "ok")
-    return entries
+    log(f"  {count} traits extraits", "ok")
 
 
-def extract_npc_abilities() -> List[dict]:
+def extract_npc_abilities() -> Iterator[dict]:
     """Extrait les capacités de PNJ (glossaire) depuis les fichiers de langue."""
-    entries = []
+    count = 0
     
     fr_file = RAW_DIR / "pf2-fr" / "lang" / "fr.json"
     en_file = RAW_DIR / "pf2e" / "static" / "lang" / "en.json"
     
     if not fr_file.exists() or not en_file.exists():
         log("Fichiers de langue non trouvés pour capacités NPC", "warn")
-        return entries
+        return
     
     log("Extraction des capacités NPC (glossaire)...", "info")
     
     try:
-        with open(fr_file, 'r', encoding='utf-8') as f:
-            fr_data = json.load(f)
-        with open(en_file, 'r', encoding='utf-8') as f:
-            en_data = json.load(f)
+        fr_data = load_lang(fr_file)
+        en_data = load_lang(en_file)
     except Exception as e:
         log(f"Erreur chargement fichiers de langue: {e}", "err")
-        return entries
+        return
     
     # Extraire le glossaire des capacités NPC
-    fr_glossary = fr_data.get("PF2E", {}).get("NPC", {}).get("Abilities", {}).get("Glossary", {})
-    en_glossary = en_data.get("PF2E", {}).get("NPC", {}).get("Abilities", {}).get("Glossary", {})
+    fr_pf2e = fr_data.get("PF2E", {})
+    en_pf2e = en_data.get("PF2E", {})
+    fr_glossary = fr_pf2e.get("NPC", {}).get("Abilities", {}).get("Glossary", {})
+    en_glossary = en_pf2e.get("NPC", {}).get("Abilities", {}).get("Glossary", {})
     
     # Aussi les AttackEffect pour les noms traduits (Grab -> Agrippement, etc.)
-    fr_attack_effects = {}
-    en_attack_effects = {}
-    for k, v in fr_data.get("PF2E", {}).items():
-        if k.startswith("AttackEffect") and isinstance(v, str):
-            key = k[len("AttackEffect"):].lower()
-            fr_attack_effects[key] = v
-    for k, v in en_data.get("PF2E", {}).items():
-        if k.startswith("AttackEffect") and isinstance(v, str):
-            key = k[len("AttackEffect"):].lower()
-            en_attack_effects[key] = v
-    
-    all_keys = set(fr_glossary.keys()) | set(en_glossary.keys())
+    fr_attack_effects = {k.lower(): v for k, v in lang_prefix_index(fr_file)["AttackEffect"]}
+    en_attack_effects = {k.lower(): v for k, v in lang_prefix_index(en_file)["AttackEffect"]}
+    
+    all_keys = fr_glossary.keys() | en_glossary.keys()
     
     for key in all_keys:
         desc_fr = fr_glossary.get(key, "")
@@ -545,64 +825,38 @@ def extract_npc_abilities() -> List[dict]:
         name_fr = fr_attack_effects.get(key.lower(), key)
         name_en = en_attack_effects.get(key.lower(), key)
         
-        entry = {
-            "_id": f"npc-ability-{key.lower()}",
-            "_pack": "npc-abilities",
-            "_pack_type": "capacité",
-            "_source": "pf2-fr+pf2e",
-            "_translated": bool(desc_fr),
-            "name": name_fr or name_en,
-            "name_fr": name_fr or name_en,
-            "name_en": name_en or name_fr,
-            "description_fr": desc_fr,
-            "type": "capacité",
-            "system": {
-                "description": {"value": desc_en or desc_fr}
-            }
-        }
-        entries.append(entry)
+        count += 1
+        yield lang_entry(f"npc-ability-{key.lower()}", "npc-abilities", "capacité",
+                         name_fr, name_en, desc_fr, desc_en, bool(desc_fr))
     
-    log(f"  {len(entries)} capacités NPC extraites", "ok")
-    return entries
+    log(f"  {count} capacités NPC extraites", "ok")
 
 
-def extract_conditions() -> List[dict]:
+def extract_conditions() -> Iterator[dict]:
     """Extrait les états/conditions depuis les fichiers de langue."""
-    entries = []
+    count = 0
     
     fr_file = RAW_DIR / "pf2-fr" / "lang" / "fr.json"
     en_file = RAW_DIR / "pf2e" / "static" / "lang" / "en.json"
     
     if not fr_file.exists() or not en_file.exists():
         log("Fichiers de langue non trouvés pour conditions", "warn")
-        return entries
+        return
     
     log("Extraction des états/conditions...", "info")
     
     try:
-        with open(fr_file, 'r', encoding='utf-8') as f:
-            fr_data = json.load(f)
-        with open(en_file, 'r', encoding='utf-8') as f:
-            en_data = json.load(f)
+        fr_index = lang_prefix_index(fr_file)
+        en_index = lang_prefix_index(en_file)
     except Exception as e:
         log(f"Erreur chargement fichiers de langue: {e}", "err")
-        return entries
+        return
     
     # Extraire les conditions (ConditionTypeXxx)
-    fr_conditions = {}
-    en_conditions = {}
-    
-    for k, v in fr_data.get("PF2E", {}).items():
-        if k.startswith("ConditionType") and isinstance(v, str):
-            cond_key = k[len("ConditionType"):].lower()
-            fr_conditions[cond_key] = v
+    fr_conditions = {k.lower(): v for k, v in fr_index["ConditionType"]}
+    en_conditions = {k.lower(): v for k, v in en_index["ConditionType"]}
     
-    for k, v in en_data.get("PF2E", {}).items():
-        if k.startswith("ConditionType") and isinstance(v, str):
-            cond_key = k[len("ConditionType"):].lower()
-            en_conditions[cond_key] = v
-    
-    all_keys = set(fr_conditions.keys()) | set(en_conditions.keys())
+    all_keys = fr_conditions.keys() | en_conditions.keys()
     
     for key in all_keys:
         name_fr = fr_conditions.get(key, "")
@@ -610,48 +864,32 @@ def extract_conditions() -> List[dict]:
         
         # Note: Les descriptions des conditions sont dans les items du compendium conditionitems
         # Ici on extrait juste les noms traduits comme référence rapide
-        entry = {
-            "_id": f"condition-{key}",
-            "_pack": "conditions",
-            "_pack_type": "état",
-            "_source": "pf2-fr+pf2e",
-            "_translated": bool(name_fr),
-            "name": name_fr or name_en,
-            "name_fr": name_fr or name_en,
-            "name_en": name_en or name_fr,
-            "description_fr": "",  # Descriptions dans les items du compendium
-            "type": "état",
-            "system": {
-                "description": {"value": ""}
-            }
-        }
-        entries.append(entry)
+        count += 1
+        yield lang_entry(f"condition-{key}", "conditions", "état", name_fr, name_en,
+                         "", "", bool(name_fr))
     
-    log(f"  {len(entries)} états/conditions extraits", "ok")
-    return entries
+    log(f"  {count} états/conditions extraits", "ok")
 
 
-def extract_materials() -> List[dict]:
+def extract_materials() -> Iterator[dict]:
     """Extrait les matériaux précieux depuis les fichiers de langue."""
-    entries = []
+    count = 0
     
     fr_file = RAW_DIR / "pf2-fr" / "lang" / "fr.json"
     en_file = RAW_DIR / "pf2e" / "static" / "lang" / "en.json"
     
     if not fr_file.exists() or not en_file.exists():
         log("Fichiers de langue non trouvés pour matériaux", "warn")
-        return entries
+        return
     
     log("Extraction des matériaux précieux...", "info")
     
     try:
-        with open(fr_file, 'r', encoding='utf-8') as f:
-            fr_data = json.load(f)
-        with open(en_file, 'r', encoding='utf-8') as f:
-            en_data = json.load(f)
+        fr_index = lang_prefix_index(fr_file)
+        en_index = lang_prefix_index(en_file)
     except Exception as e:
         log(f"Erreur chargement fichiers de langue: {e}", "err")
-        return entries
+        return
     
     # Extraire les noms et descriptions des matériaux précieux
     fr_names = {}
@@ -659,26 +897,20 @@ def extract_materials() -> List[dict]:
     en_names = {}
     en_descs = {}
     
-    for k, v in fr_data.get("PF2E", {}).items():
-        if k.startswith("PreciousMaterial") and isinstance(v, str):
-            if "Description" in k:
-                mat_key = k[len("PreciousMaterial"):-len("Description")].lower()
-                fr_descs[mat_key] = v
-            elif "Grade" not in k and "Label" not in k:
-                mat_key = k[len("PreciousMaterial"):].lower()
-                fr_names[mat_key] = v
-    
-    for k, v in en_data.get("PF2E", {}).items():
-        if k.startswith("PreciousMaterial") and isinstance(v, str):
-            if "Description" in k:
-                mat_key = k[len("PreciousMaterial"):-len("Description")].lower()
-                en_descs[mat_key] = v
-            elif "Grade" not in k and "Label" not in k:
-                mat_key = k[len("PreciousMaterial"):].lower()
-                en_names[mat_key] = v
+    for k, v in fr_index["PreciousMaterial"]:
+        if "Description" in k:
+            fr_descs[k[:-len("Description")].lower()] = v
+        elif "Grade" not in k and "Label" not in k:
+            fr_names[k.lower()] = v
+    
+    for k, v in en_index["PreciousMaterial"]:
+        if "Description" in k:
+            en_descs[k[:-len("Description")].lower()] = v
+        elif "Grade" not in k and "Label" not in k:
+            en_names[k.lower()] = v
     
     # Ne garder que les matériaux qui ont une description
-    all_keys = set(fr_descs.keys()) | set(en_descs.keys())
+    all_keys = fr_descs.keys() | en_descs.keys()
     
     for key in all_keys:
         name_fr = fr_names.get(key, key.capitalize())
@@ -686,133 +918,76 @@ def extract_materials() -> List[dict]:
         desc_fr = fr_descs.get(key, "")
         desc_en = en_descs.get(key, "")
         
-        entry = {
-            "_id": f"material-{key}",
-            "_pack": "materials",
-            "_pack_type": "matériau",
-            "_source": "pf2-fr+pf2e",
-            "_translated": bool(desc_fr),
-            "name": name_fr or name_en,
-            "name_fr": name_fr or name_en,
-            "name_en": name_en or name_fr,
-            "description_fr": desc_fr,
-            "type": "matériau",
-            "system": {
-                "description": {"value": desc_en or desc_fr}
-            }
-        }
-        entries.append(entry)
+        count += 1
+        yield lang_entry(f"material-{key}", "materials", "matériau", name_fr, name_en,
+                         desc_fr, desc_en, bool(desc_fr))
     
-    log(f"  {len(entries)} matériaux précieux extraits", "ok")
-    return entries
+    log(f"  {count} matériaux précieux extraits", "ok")
 
 
-def extract_glossary() -> List[dict]:
+def extract_glossary() -> Iterator[dict]:
     """Extrait les termes génériques du glossaire depuis les fichiers de langue."""
-    entries = []
+    count = 0
     
     fr_file = RAW_DIR / "pf2-fr" / "lang" / "fr.json"
     en_file = RAW_DIR / "pf2e" / "static" / "lang" / "en.json"
     
     if not fr_file.exists() or not en_file.exists():
         log("Fichiers de langue non trouvés pour glossaire", "warn")
-        return entries
+        return
     
     log("Extraction du glossaire général...", "info")
     
     try:
-        with open(fr_file, 'r', encoding='utf-8') as f:
-            fr_data = json.load(f)
-        with open(en_file, 'r', encoding='utf-8') as f:
-            en_data = json.load(f)
+        fr_data = load_lang(fr_file)
+        en_data = load_lang(en_file)
     except Exception as e:
         log(f"Erreur chargement fichiers de langue: {e}", "err")
-        return entries
+        return
     
     fr_pf2e = fr_data.get("PF2E", {})
     en_pf2e = en_data.get("PF2E", {})
-    
-    # Définir les catégories à extraire
-    categories = {
-        "ActorSize": ("taille", "Taille"),
-        "ProficiencyLevel": ("maîtrise", "Niveau de maîtrise"),
-        "DCAdjustment": ("dd", "Ajustement DD"),
-        "ActionType": ("type-action", "Type d'action"),
-        "PreparationType": ("préparation", "Type de préparation"),
-        "WeaponGroup": ("groupe-arme", "Groupe d'armes"),
-        "ArmorGroup": ("groupe-armure", "Groupe d'armures"),
-        "WeaponType": ("type-arme", "Type d'arme"),
-        "ArmorType": ("type-armure", "Type d'armure"),
-        "Currency": ("devise", "Devise"),
-    }
-    
-    # Extraire les clés simples (string values)
-    for prefix, (id_prefix, category_label) in categories.items():
-        fr_items = {k: v for k, v in fr_pf2e.items() 
-                    if k.startswith(prefix) and isinstance(v, str)
-                    and "Label" not in k and "Header" not in k and "Title" not in k}
-        en_items = {k: v for k, v in en_pf2e.items() 
-                    if k.startswith(prefix) and isinstance(v, str)
-                    and "Label" not in k and "Header" not in k and "Title" not in k}
+    fr_index = lang_prefix_index(fr_file)
+    en_index = lang_prefix_index(en_file)
+    
+    # Extraire les clés simples (string values), indexées par suffixe
+    # (ex: "ActorSizeLarge" -> "Large")
+    for prefix, (id_prefix, category_label) in GLOSSARY_CATEGORIES.items():
+        fr_items = {k: v for k, v in fr_index[prefix]
+                    if "Label" not in k and "Header" not in k and "Title" not in k}
+        en_items = {k: v for k, v in en_index[prefix]
+                    if "Label" not in k and "Header" not in k and "Title" not in k}
         
-        all_keys = set(fr_items.keys()) | set(en_items.keys())
+        all_keys = fr_items.keys() | en_items.keys()
         
-        for key in all_keys:
-            # Extraire le suffixe (ex: "ActorSizeLarge" -> "Large")
-            suffix = key[len(prefix):]
+        for suffix in all_keys:
             if not suffix:
                 continue
                 
-            name_fr = fr_items.get(key, "")
-            name_en = en_items.get(key, "")
+            name_fr = fr_items.get(suffix, "")
+            name_en = en_items.get(suffix, "")
             
             if not name_fr and not name_en:
                 continue
             
-            entry = {
-                "_id": f"glossaire-{id_prefix}-{suffix.lower()}",
-                "_pack": "glossaire",
-                "_pack_type": "glossaire",
-                "_source": "pf2-fr+pf2e",
-                "_translated": bool(name_fr),
-                "name": name_fr or name_en,
-                "name_fr": name_fr or name_en,
-                "name_en": name_en or name_fr,
-                "description_fr": f"Catégorie: {category_label}",
-                "type": "glossaire",
-                "glossary_category": category_label,
-                "system": {
-                    "description": {"value": f"Category: {category_label}"}
-                }
-            }
-            entries.append(entry)
+            count += 1
+            yield lang_entry(f"glossaire-{id_prefix}-{suffix.lower()}", "glossaire", "glossaire",
+                             name_fr, name_en, f"Catégorie: {category_label}",
+                             f"Category: {category_label}", bool(name_fr), category_label)
     
     # Extraire les compétences (Skill dict)
     fr_skills = fr_pf2e.get("Skill", {})
     en_skills = en_pf2e.get("Skill", {})
     if isinstance(fr_skills, dict) and isinstance(en_skills, dict):
-        all_skill_keys = set(fr_skills.keys()) | set(en_skills.keys())
+        all_skill_keys = fr_skills.keys() | en_skills.keys()
         for key in all_skill_keys:
             fr_val = fr_skills.get(key, "")
             en_val = en_skills.get(key, "")
             if isinstance(fr_val, str) and isinstance(en_val, str):
-                entry = {
-                    "_id": f"glossaire-compétence-{key.lower()}",
-                    "_pack": "glossaire",
-                    "_pack_type": "glossaire",
-                    "_source": "pf2-fr+pf2e",
-                    "_translated": bool(fr_val),
-                    "name": fr_val or en_val,
-                    "name_fr": fr_val or en_val,
-                    "name_en": en_val or fr_val,
-                    "description_fr": "Catégorie: Compétence",
-                    "type": "glossaire",
-                    "glossary_category": "Compétence",
-                    "system": {
-                        "description": {"value": "Category: Skill"}
-                    }
-                }
-                entries.append(entry)
+                count += 1
+                yield lang_entry(f"glossaire-compétence-{key.lower()}", "glossaire", "glossaire", fr_val, en_val,
+                                 "Catégorie: Compétence", "Category: Skill",
+                                 bool(fr_val), "Compétence")
     
     # Extraire les types de dégâts (Damage.IWR.Type)
     fr_damage = fr_pf2e.get("Damage", {})
@@ -821,28 +996,15 @@ def extract_glossary() -> List[dict]:
         fr_types = fr_damage.get("IWR", {}).get("Type", {}) if isinstance(fr_damage.get("IWR"), dict) else {}
         en_types = en_damage.get("IWR", {}).get("Type", {}) if isinstance(en_damage.get("IWR"), dict) else {}
         
-        all_damage_keys = set(fr_types.keys()) | set(en_types.keys())
+        all_damage_keys = fr_types.keys() | en_types.keys()
         for key in all_damage_keys:
             fr_val = fr_types.get(key, "")
             en_val = en_types.get(key, "")
             if fr_val or en_val:
-                entry = {
-                    "_id": f"glossaire-dégât-{key.lower()}",
-                    "_pack": "glossaire",
-                    "_pack_type": "glossaire",
-                    "_source": "pf2-fr+pf2e",
-                    "_translated": bool(fr_val),
-                    "name": fr_val or en_val,
-                    "name_fr": fr_val or en_val,
-                    "name_en": en_val or fr_val,
-                    "description_fr": "Catégorie: Type de dégât/immunité/résistance",
-                    "type": "glossaire",
-                    "glossary_category": "Type de dégât",
-                    "system": {
-                        "description": {"value": "Category: Damage/IWR Type"}
-                    }
-                }
-                entries.append(entry)
+                count += 1
+                yield lang_entry(f"glossaire-dégât-{key.lower()}", "glossaire", "glossaire", fr_val, en_val,
+                                 "Catégorie: Type de dégât/immunité/résistance", "Category: Damage/IWR Type",
+                                 bool(fr_val), "Type de dégât")
     
     # Extraire les formes de zone (Area.Shape)
     fr_area = fr_pf2e.get("Area", {})
@@ -851,55 +1013,29 @@ def extract_glossary() -> List[dict]:
         fr_shapes = fr_area.get("Shape", {}) if isinstance(fr_area.get("Shape"), dict) else {}
         en_shapes = en_area.get("Shape", {}) if isinstance(en_area.get("Shape"), dict) else {}
         
-        all_shape_keys = set(fr_shapes.keys()) | set(en_shapes.keys())
+        all_shape_keys = fr_shapes.keys() | en_shapes.keys()
         for key in all_shape_keys:
             fr_val = fr_shapes.get(key, "")
             en_val = en_shapes.get(key, "")
             if fr_val or en_val:
-                entry = {
-                    "_id": f"glossaire-zone-{key.lower()}",
-                    "_pack": "glossaire",
-                    "_pack_type": "glossaire",
-                    "_source": "pf2-fr+pf2e",
-                    "_translated": bool(fr_val),
-                    "name": fr_val or en_val,
-                    "name_fr": fr_val or en_val,
-                    "name_en": en_val or fr_val,
-                    "description_fr": "Catégorie: Forme de zone",
-                    "type": "glossaire",
-                    "glossary_category": "Forme de zone",
-                    "system": {
-                        "description": {"value": "Category: Area Shape"}
-                    }
-                }
-                entries.append(entry)
+                count += 1
+                yield lang_entry(f"glossaire-zone-{key.lower()}", "glossaire", "glossaire", fr_val, en_val,
+                                 "Catégorie: Forme de zone", "Category: Area Shape",
+                                 bool(fr_val), "Forme de zone")
     
     # Extraire les durées (Duration dict)
     fr_duration = fr_pf2e.get("Duration", {})
     en_duration = en_pf2e.get("Duration", {})
     if isinstance(fr_duration, dict) and isinstance(en_duration, dict):
-        all_dur_keys = set(fr_duration.keys()) | set(en_duration.keys())
+        all_dur_keys = fr_duration.keys() | en_duration.keys()
         for key in all_dur_keys:
             fr_val = fr_duration.get(key, "")
             en_val = en_duration.get(key, "")
             if isinstance(fr_val, str) and isinstance(en_val, str):
-                entry = {
-                    "_id": f"glossaire-durée-{key.lower()}",
-                    "_pack": "glossaire",
-                    "_pack_type": "glossaire",
-                    "_source": "pf2-fr+pf2e",
-                    "_translated": bool(fr_val),
-                    "name": fr_val or en_val,
-                    "name_fr": fr_val or en_val,
-                    "name_en": en_val or fr_val,
-                    "description_fr": "Catégorie: Durée",
-                    "type": "glossaire",
-                    "glossary_category": "Durée",
-                    "system": {
-                        "description": {"value": "Category: Duration"}
-                    }
-                }
-                entries.append(entry)
+                count += 1
+                yield lang_entry(f"glossaire-durée-{key.lower()}", "glossaire", "glossaire", fr_val, en_val,
+                                 "Catégorie: Durée", "Category: Duration",
+                                 bool(fr_val), "Durée")
     
     # Extraire les jets de sauvegarde
     saves_mapping = {
@@ -911,26 +1047,16 @@ def extract_glossary() -> List[dict]:
         fr_val = fr_pf2e.get(key, "")
         en_val = en_pf2e.get(key, "")
         if fr_val or en_val:
-            entry = {
-                "_id": f"glossaire-sauvegarde-{key.replace('Saves', '').lower()}",
-                "_pack": "glossaire",
-                "_pack_type": "glossaire",
-                "_source": "pf2-fr+pf2e",
-                "_translated": bool(fr_val),
-                "name": fr_val or en_val,
-                "name_fr": fr_val or default_fr,
-                "name_en": en_val or key.replace('Saves', ''),
-                "description_fr": "Catégorie: Jet de sauvegarde",
-                "type": "glossaire",
-                "glossary_category": "Jet de sauvegarde",
-                "system": {
-                    "description": {"value": "Category: Saving Throw"}
-                }
-            }
-            entries.append(entry)
-    
-    log(f"  {len(entries)} entrées de glossaire extraites", "ok")
-    return entries
+            entry = lang_entry(f"glossaire-sauvegarde-{key.replace('Saves', '').lower()}", "glossaire",
+                               "glossaire", fr_val, en_val, "Catégorie: Jet de sauvegarde",
+                               "Category: Saving Throw", bool(fr_val), "Jet de sauvegarde")
+            # Noms par défaut propres aux jets de sauvegarde
+            entry["name_fr"] = fr_val or default_fr
+            entry["name_en"] = en_val or key.replace('Saves', '')
+            count += 1
+            yield entry
+    
+    log(f"  {count} entrées de glossaire extraites", "ok")
 
 
 def load_all_translations() -> Tuple[Dict[str, Translation], Dict[str, str]]:
@@ -943,34 +1069,36 @@ def load_all_translations() -> Tuple[Dict[str, Translation], Dict[str, str]]:
         return translations, {}
     
     # Parcourir tous les dossiers (chaque dossier = un pack)
-    pack_dirs = [d for d in data_dir.iterdir() if d.is_dir()]
+    with os.scandir(data_dir) as it:
+        pack_dirs = [(e.name, e.path) for e in it if e.is_dir()]
     
     log(f"Chargement traductions depuis {len(pack_dirs)} packs...", "info")
     
     total = 0
     items_total = 0
     
-    for pack_dir in pack_dirs:
-        pack_name = pack_dir.name
-        
-        # Fichiers .htm directs dans le pack
-        htm_files = list(pack_dir.glob("*.htm"))
-        
-        # Aussi chercher dans les sous-dossiers (pour journals/pages-*)
-        for subdir in pack_dir.iterdir():
-            if subdir.is_dir():
-                htm_files.extend(subdir.glob("*.htm"))
-        
-        pack_count = 0
-        for htm_file in htm_files:
-            trans = parse_htm_file(htm_file, pack_name)
+    htm_files = []
+    htm_packs = []
+    for pack_name, pack_path in pack_dirs:
+        # Fichiers .htm directs dans le pack, puis un niveau de
+        # sous-dossiers (pour journals/pages-*)
+        pack_files = list(iter_files(pack_path, ".htm", depth=1))
+        htm_files.extend(pack_files)
+        htm_packs.extend([pack_name] * len(pack_files))
+    
+    # Fichiers indépendants: parsing réparti sur tous les cœurs.
+    # map() conserve l'ordre, donc les doublons d'UUID se résolvent comme avant.
+    with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as ex:
+        for trans in ex.map(parse_htm_file, htm_files, htm_packs, chunksize=64):
             if trans:
+                # Chaque résultat revient du worker avec ses propres copies du
+                # nom de pack et du statut (quelques valeurs distinctes)
+                trans.pack = sys.intern(trans.pack)
+                trans.status = sys.intern(trans.status)
                 translations[trans.uuid] = trans
-                pack_count += 1
-                items_total += len(trans.items)
-        
-        if pack_count > 0:
-            total += pack_count
+                total += 1
+                if trans.items:
+                    items_total += len(trans.items)
     
     log(f"  {total} traductions, {items_total} items traduits", "ok")
     
@@ -985,23 +1113,43 @@ def load_all_translations() -> Tuple[Dict[str, Translation], Dict[str, str]]:
 # PARSING DES FICHIERS FOUNDRY (.json)
 # ============================================================================
 
-def parse_json_file(filepath: Path) -> Optional[dict]:
+def parse_json_file(filepath: str) -> Optional[dict]:
     """Parse un fichier JSON individuel."""
     try:
-        content = filepath.read_text(encoding="utf-8")
-        entry = json.loads(content)
+        with open(filepath, "rb") as f:
+            entry = json_loads(f.read())
         if isinstance(entry, dict):
             return entry
-    except:
+    except (OSError, ValueError):
+        # ValueError couvre les erreurs de décodage JSON (json et orjson)
         pass
     return None
 
 
+def intern_traits(system: dict):
+    """Partage les chaînes de traits et de rareté (peu de valeurs distinctes).
+    
+    Les clés JSON sont déjà partagées par orjson (cache de clés); ces valeurs se
+    répètent sur des dizaines de milliers d'entrées gardées en mémoire.
+    """
+    traits = system.get("traits")
+    if not isinstance(traits, dict):
+        return
+    values = traits.get("value")
+    if isinstance(values, list):
+        traits["value"] = [sys.intern(v) if isinstance(v, str) else v for v in values]
+    rarity = traits.get("rarity")
+    if isinstance(rarity, str):
+        traits["rarity"] = sys.intern(rarity)
+
+
 def apply_translation(entry: dict, trans: Optional[Translation], journals: Dict[str, str] = None) -> dict:
     """Applique une traduction à une entrée Foundry."""
     if not trans:
-        entry["name_fr"] = entry.get("name", "")
-        entry["name_en"] = entry.get("name", "")
+        # Chemin rapide: ni journaux ni items à parcourir
+        name = entry.get("name", "")
+        entry["name_fr"] = name
+        entry["name_en"] = name
         entry["description_fr"] = ""
         entry["_translated"] = False
         return entry
@@ -1016,9 +1164,11 @@ def apply_translation(entry: dict, trans: Optional[Translation], journals: Dict[
     entry_type = entry.get("type", "")
     if journals and entry_type in ["class", "ancestry", "archetype"]:
         # Chercher une référence @UUID vers un journal dans la description
-        desc = trans.desc_fr or trans.desc_en or ""
+        desc = trans.desc_fr
         # Format: @UUID[Compendium.pf2e.journals.JournalEntry.XXX.JournalEntryPage.YYY]{...}
-        match = re.search(r'@UUID\[Compendium\.pf2e\.journals\.JournalEntry\.[^.]+\.JournalEntryPage\.([^\]]+)\]', desc)
+        # str.find écarte d'abord les descriptions sans référence (la plupart)
+        idx = desc.find(JOURNAL_REF_PREFIX)
+        match = RE_JOURNAL_REF.search(desc, idx) if idx >= 0 else None
         if match:
             page_uuid = match.group(1)
             if page_uuid in journals:
@@ -1026,13 +1176,14 @@ def apply_translation(entry: dict, trans: Optional[Translation], journals: Dict[
                 entry["_has_journal"] = True
     
     # Appliquer les traductions aux items (attaques, capacités)
-    if "items" in entry and trans.items:
-        for item in entry.get("items", []):
+    trans_items = trans.items
+    if trans_items and "items" in entry:
+        for item in entry["items"]:
             if not isinstance(item, dict):
                 continue
-            item_id = item.get("_id", "")
-            if item_id and item_id in trans.items:
-                item_trans = trans.items[item_id]
+            # Une seule recherche par item (les id vides ne sont jamais des clés)
+            item_trans = trans_items.get(item.get("_id", ""))
+            if item_trans:
                 item["name_fr"] = item_trans.name_fr
                 item["name_en"] = item_trans.name_en or item.get("name", "")
                 if item_trans.desc_fr:
@@ -1066,73 +1217,82 @@ def extract_foundry_with_translations(translations: Dict[str, Translation], jour
         return entries, dict(stats)
     
     # Chercher tous les fichiers JSON (nouveau format: un fichier = une entrée)
-    all_files = list(packs_dir.glob("**/*.json"))
     # Exclure les fichiers _folders.json et _source.json
-    all_files = [f for f in all_files if not f.name.startswith("_")]
+    root = str(packs_dir)
+    all_files = list(iter_files(root, ".json", skip_prefix="_"))
     
     log(f"Extraction de {len(all_files)} fichiers Foundry...", "info")
     
     translated_count = 0
-    pack_stats = defaultdict(lambda: {"total": 0, "translated": 0})
-    
-    for filepath in all_files:
-        # Déterminer le pack depuis le chemin
-        # Structure: packs/pf2e/{pack-name}/.../{file}.json
-        rel_path = filepath.relative_to(packs_dir)
-        pack_name = rel_path.parts[0] if rel_path.parts else "unknown"
-        
-        item = parse_json_file(filepath)
-        if not item or not isinstance(item, dict):
-            continue
-        
-        entry_id = item.get("_id", "")
-        if not entry_id:
-            continue
-        
-        unique_key = f"{pack_name}:{entry_id}"
-        if unique_key in seen_keys:
-            continue
-        seen_keys.add(unique_key)
-        
-        # Chercher la traduction par UUID
-        trans = translations.get(entry_id)
-        
-        # Détecter le type
-        entry_type = detect_type_from_entry(item)
-        if entry_type == "autre":
-            entry_type = detect_type_from_pack(pack_name)
-        
-        # Appliquer traduction (avec journaux pour les classes)
-        item = apply_translation(item, trans, journals)
-        
-        # Construire l'entrée finale
-        entry = {
-            "_id": entry_id,
-            "_pack": pack_name,
-            "_pack_type": entry_type,
-            "_source": "foundry+pf2-fr",
-            "_translated": item.get("_translated", False),
-            "name": item.get("name_fr") or item.get("name", ""),
-            "name_fr": item.get("name_fr") or item.get("name", ""),
-            "name_en": item.get("name_en") or item.get("name", ""),
-            "description": item.get("description_fr") or "",
-            "type": item.get("type", ""),
-            "system": item.get("system", {}),
-            "items": item.get("items", []),
-        }
-        
-        entries.append(entry)
-        stats[entry_type] += 1
-        pack_stats[pack_name]["total"] += 1
-        if item.get("_translated"):
-            pack_stats[pack_name]["translated"] += 1
-            translated_count += 1
+    # Compteurs par pack: deux dicts d'entiers plutôt qu'un dict par pack
+    pack_total = defaultdict(int)
+    pack_translated = defaultdict(int)
+    
+    # Lectures en parallèle (threads), résultats consommés dans l'ordre des fichiers
+    with ThreadPoolExecutor(max_workers=READ_THREADS) as ex:
+        for filepath, item in zip(all_files, ex.map(parse_json_file, all_files)):
+            # Déterminer le pack depuis le chemin
+            # Structure: packs/pf2e/{pack-name}/.../{file}.json
+            pack_name = sys.intern(filepath[len(root) + 1:].split(os.sep, 1)[0] or "unknown")
+            
+            if not item:  # dict ou None
+                continue
+            
+            entry_id = item.get("_id", "")
+            if not entry_id:
+                continue
+            
+            unique_key = (pack_name, entry_id)
+            if unique_key in seen_keys:
+                continue
+            seen_keys.add(unique_key)
+            
+            # Chercher la traduction par UUID
+            trans = translations.get(entry_id)
+            
+            # Détecter le type
+            entry_type = detect_type_from_entry(item)
+            if entry_type == "autre":
+                entry_type = detect_type_from_pack(pack_name)
+            
+            # Appliquer traduction (avec journaux pour les classes)
+            item = apply_translation(item, trans, journals)
+            system = item.get("system", {})
+            if isinstance(system, dict):
+                intern_traits(system)
+            
+            # Construire l'entrée finale (chaque clé lue une seule fois)
+            translated = item["_translated"]  # toujours posé par apply_translation
+            name = item.get("name", "")
+            name_fr = item["name_fr"] or name
+            entry = {
+                "_id": entry_id,
+                "_pack": pack_name,
+                "_pack_type": entry_type,
+                "_source": "foundry+pf2-fr",
+                "_translated": translated,
+                "name": name_fr,
+                "name_fr": name_fr,
+                "name_en": item["name_en"] or name,
+                "description": item["description_fr"] or "",
+                "type": item.get("type", ""),
+                "system": system,
+                "items": item.get("items", []),
+            }
+            
+            entries.append(entry)
+            stats[entry_type] += 1
+            pack_total[pack_name] += 1
+            if translated:
+                pack_translated[pack_name] += 1
+                translated_count += 1
     
     # Afficher stats par pack (top 10)
-    sorted_packs = sorted(pack_stats.items(), key=lambda x: -x[1]["total"])[:10]
-    for pack_name, pstats in sorted_packs:
-        pct = (pstats["translated"] / pstats["total"] * 100) if pstats["total"] else 0
-        log(f"  {pack_name}: {pstats['total']} entrées ({pstats['translated']} FR, {pct:.0f}%)", "dim")
+    sorted_packs = sorted(pack_total.items(), key=lambda x: -x[1])[:10]
+    for pack_name, total in sorted_packs:
+        pack_fr = pack_translated[pack_name]
+        pct = (pack_fr / total * 100) if total else 0
+        log(f"  {pack_name}: {total} entrées ({pack_fr} FR, {pct:.0f}%)", "dim")
     
     log(f"  Total: {len(entries)} entrées, {translated_count} traduites", "ok")
     return entries, dict(stats)
@@ -1141,102 +1301,269 @@ def extract_foundry_with_translations(translations: Dict[str, Translation], jour
 # BASE DE DONNÉES
 # ============================================================================
 
-def create_database(entries: List[dict], stats: dict):
+INSERT_BATCH = 10000  # Lignes accumulées avant écriture (borne la mémoire des tuples)
+SQLITE_MAX_VARS = 999  # Limite historique de paramètres liés par requête SQLite
+
+ENTRY_COLUMNS = ("rowid", "id", "pack", "name_fr", "name_en", "type", "source", "translated", "data",
+                 "level", "name_fr_norm", "name_en_norm")
+TRAIT_COLUMNS = ("entry_rowid", "trait", "trait_lower")
+
+# Index créés après l'insertion en masse (pas de maintenance ligne par ligne)
+# pack: déjà couvert par la clé primaire (pack, id)
+INDEX_SQL = (
+    'CREATE INDEX idx_name_fr ON entries(name_fr COLLATE NOCASE)',
+    'CREATE INDEX idx_name_en ON entries(name_en COLLATE NOCASE)',
+    'CREATE INDEX idx_type ON entries(type)',
+    'CREATE INDEX idx_id ON entries(id)',
+    # Couvrant: les recherches par trait ne lisent que l'index
+    'CREATE INDEX idx_trait ON entry_traits(trait_lower, entry_rowid)',
+    # Décompte par trait (commande "traits"): GROUP BY parcouru dans l'ordre de l'index
+    'CREATE INDEX idx_trait_name ON entry_traits(trait)',
+)
+
+# Remplissage FTS en une passe depuis entries (description: chaîne ou {"value": ...})
+FTS_POPULATE_SQL = '''INSERT INTO entries_fts (rowid, name_fr, name_en, pack, description)
+    SELECT rowid, name_fr, name_en, pack, substr(coalesce(CASE json_type(data, '$.description')
+        WHEN 'object' THEN json_extract(data, '$.description.value')
+        WHEN 'text' THEN json_extract(data, '$.description') END, ''), 1, 5000)
+    FROM entries'''
+
+# Index des noms pour pf2_search: colonnes normalisées de entries (sans accents,
+# minuscules), découpées en trigrammes pour retrouver une sous-chaîne n'importe
+# où dans le nom. Contenu externe: les noms ne sont pas stockés une seconde fois
+NAMES_FTS_SQL = '''CREATE VIRTUAL TABLE names_fts USING fts5(
+    name_fr_norm, name_en_norm, content=entries, content_rowid=rowid, tokenize="trigram")'''
+
+NAMES_FTS_POPULATE_SQL = '''INSERT INTO names_fts (rowid, name_fr_norm, name_en_norm)
+    SELECT rowid, name_fr_norm, name_en_norm FROM entries'''
+
+
+def entry_trait_values(entry: dict) -> List[str]:
+    """Traits (system.traits.value) d'une entrée, chaînes uniquement."""
+    system = entry.get("system")
+    traits = system.get("traits") if isinstance(system, dict) else None
+    values = traits.get("value") if isinstance(traits, dict) else None
+    if not isinstance(values, list):
+        return []
+    return [t for t in values if isinstance(t, str)]
+
+
+def entry_level(entry: dict):
+    """Niveau (system.level, nombre ou {"value": n}) d'une entrée, 0 si absent."""
+    system = entry.get("system")
+    level = system.get("level") if isinstance(system, dict) else None
+    if isinstance(level, dict):
+        level = level.get("value", 0)
+    return level or 0
+
+
+def normalize_text(text: str) -> str:
+    """Retire les accents et met en minuscules (identique à pf2_search_v5.normalize_text)."""
+    normalized = unicodedata.normalize('NFD', text)
+    return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn').lower()
+
+
+@lru_cache(maxsize=None)
+def values_sql(table: str, columns: Tuple[str, ...], nrows: int) -> str:
+    """Requête INSERT à nrows groupes VALUES, construite une fois par forme.
+    
+    La même chaîne (objet identique) est repassée à sqlite3, qui retrouve
+    ainsi la requête déjà préparée dans son cache de statements.
+    """
+    row_sql = "(" + ", ".join("?" * len(columns)) + ")"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ", ".join([row_sql] * nrows)
+
+
+def insert_rows(cur: sqlite3.Cursor, table: str, columns: Tuple[str, ...], rows: List[tuple]):
+    """Insère des lignes en regroupant plusieurs VALUES (...) par requête."""
+    per_stmt = max(1, SQLITE_MAX_VARS // len(columns))
+    
+    for start in range(0, len(rows), per_stmt):
+        chunk = rows[start:start + per_stmt]
+        # Requête pleine réutilisée telle quelle, une plus courte pour le reste
+        sql = values_sql(table, columns, len(chunk))
+        cur.execute(sql, [v for row in chunk for v in row])
+
+
+def create_database(entries: Iterable[dict], stats: dict):
+    """Écrit la base en un seul passage sur entries (liste ou générateur)."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     if DB_FILE.exists():
         DB_FILE.unlink()
     
     log("Création base de données...", "info")
-    conn = sqlite3.connect(str(DB_FILE))
+    # Autocommit: les transactions sont gérées explicitement (BEGIN/COMMIT)
+    conn = sqlite3.connect(str(DB_FILE), isolation_level=None, cached_statements=256)
     cur = conn.cursor()
     
+    # Avant toute table: pages de 8 Ko, moins de pages pour les JSON volumineux
+    cur.execute('PRAGMA page_size=8192')
+    # Base régénérable (relancer l'extraction en cas d'échec): pas besoin de durabilité
+    cur.execute('PRAGMA journal_mode=MEMORY')
+    cur.execute('PRAGMA synchronous=OFF')
+    cur.execute('PRAGMA temp_store=MEMORY')
+    cur.execute('PRAGMA cache_size=-200000')
+    # Seul écrivain: verrou pris une fois au lieu d'à chaque transaction
+    cur.execute('PRAGMA locking_mode=EXCLUSIVE')
+    
     cur.execute('''CREATE TABLE entries (
         id TEXT NOT NULL, pack TEXT NOT NULL,
         name_fr TEXT NOT NULL, name_en TEXT NOT NULL,
         type TEXT NOT NULL, source TEXT NOT NULL,
         translated INTEGER NOT NULL, data TEXT NOT NULL,
+        level INTEGER, name_fr_norm TEXT NOT NULL, name_en_norm TEXT NOT NULL,
         PRIMARY KEY (pack, id))''')
     
-    cur.execute('CREATE INDEX idx_name_fr ON entries(name_fr COLLATE NOCASE)')
-    cur.execute('CREATE INDEX idx_name_en ON entries(name_en COLLATE NOCASE)')
-    cur.execute('CREATE INDEX idx_type ON entries(type)')
-    cur.execute('CREATE INDEX idx_pack ON entries(pack)')
-    cur.execute('CREATE INDEX idx_id ON entries(id)')
-    
     cur.execute('''CREATE VIRTUAL TABLE entries_fts USING fts5(
         name_fr, name_en, pack, description,
         content=entries, content_rowid=rowid)''')
     
+    # Sans tokenizer trigram (SQLite < 3.34), pas d'index des noms: pf2_search
+    # parcourt alors les colonnes normalisées, plus lentement
+    try:
+        cur.execute(NAMES_FTS_SQL)
+        names_fts = True
+    except sqlite3.OperationalError:
+        log(f"SQLite {sqlite3.sqlite_version} sans tokenizer trigram (3.34+): recherche des noms par parcours", "warn")
+        names_fts = False
+    
+    # Une ligne par trait d'entrée (dans l'ordre de system.traits.value): filtres
+    # et décomptes par trait sans décoder le JSON
+    cur.execute('''CREATE TABLE entry_traits (
+        entry_rowid INTEGER NOT NULL, trait TEXT NOT NULL, trait_lower TEXT NOT NULL)''')
+    
     cur.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)')
     
-    log(f"Insertion {len(entries)} entrées...", "dim")
+    log("Insertion des entrées...", "dim")
+    
+    rows = []
+    trait_rows = []
+    
+    # Une seule transaction pour tout l'import (pas de fsync par ligne)
+    cur.execute("BEGIN")
     inserted = 0
+    trans_ct = 0
+    seen_keys = set()
     for entry in entries:
         entry_id = entry.get("_id", "")
         pack = entry.get("_pack", "unknown")
+        # Doublons (pack, id) filtrés ici plutôt que via IntegrityError
+        key = (pack, entry_id)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        # Compté après le filtrage: seules les lignes écrites sont des traductions
+        translated = 1 if entry.get("_translated", False) else 0
+        trans_ct += translated
+        
         name_fr = entry.get("name_fr", "")
         name_en = entry.get("name_en", "")
         entry_type = entry.get("_pack_type", "autre")
         source = entry.get("_source", "unknown")
-        translated = 1 if entry.get("_translated", False) else 0
-        desc = entry.get("description", "")
-        if isinstance(desc, dict):
-            desc = desc.get("value", "")
-        data_json = json.dumps(entry, ensure_ascii=False)
+        data_json = json_dumps(entry)
         
-        try:
-            cur.execute('INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
-                       (entry_id, pack, name_fr, name_en, entry_type, source, translated, data_json))
-            rowid = cur.lastrowid
-            cur.execute('INSERT INTO entries_fts (rowid, name_fr, name_en, pack, description) VALUES (?, ?, ?, ?, ?)',
-                       (rowid, name_fr, name_en, pack, desc[:5000]))
-            inserted += 1
-        except sqlite3.IntegrityError:
-            pass
-    
-    trans_ct = sum(1 for e in entries if e.get("_translated"))
+        # rowid explicite: entries_fts reprend le même rowid
+        inserted += 1
+        # Colonnes dérivées: tri et recherche par nom sans décoder data
+        rows.append((inserted, entry_id, pack, name_fr, name_en, entry_type, source, translated, data_json,
+                     entry_level(entry), normalize_text(name_fr), normalize_text(name_en)))
+        for trait in entry_trait_values(entry):
+            trait_rows.append((inserted, trait, trait.lower()))
+        if len(rows) >= INSERT_BATCH:
+            insert_rows(cur, "entries", ENTRY_COLUMNS, rows)
+            insert_rows(cur, "entry_traits", TRAIT_COLUMNS, trait_rows)
+            rows.clear()
+            trait_rows.clear()
+    insert_rows(cur, "entries", ENTRY_COLUMNS, rows)
+    insert_rows(cur, "entry_traits", TRAIT_COLUMNS, trait_rows)
+    rows.clear()
+    trait_rows.clear()
+    
+    # FTS puis index secondaires, une seule fois après les insertions
+    cur.execute(FTS_POPULATE_SQL)
+    if names_fts:
+        cur.execute(NAMES_FTS_POPULATE_SQL)
+    for sql in INDEX_SQL:
+        cur.execute(sql)
     
     meta = {"created_at": datetime.now().isoformat(), "total": inserted,
             "translated": trans_ct, "stats": json.dumps(stats), "version": "6.0"}
-    for k, v in meta.items():
-        cur.execute('INSERT INTO metadata VALUES (?, ?)', (k, str(v)))
+    cur.executemany('INSERT INTO metadata VALUES (?, ?)', [(k, str(v)) for k, v in meta.items()])
     
-    conn.commit()
+    cur.execute("COMMIT")
+    # Statistiques pour le planificateur de requêtes
+    cur.execute("ANALYZE")
     conn.close()
     
     size_mb = DB_FILE.stat().st_size / (1024 * 1024)
     log(f"Base créée: {size_mb:.1f} MB, {inserted} entrées", "ok")
     log(f"  {trans_ct} traduites ({trans_ct/inserted*100:.1f}%)", "dim")
 
+# ============================================================================
+# CACHE D'EXTRACTION
+# ============================================================================
+
+CACHE_SUFFIX = ".pkl.zst" if zstandard else ".pkl.gz"
+
+
+def tree_signature(root: Path) -> str:
+    """Empreinte (chemin, taille, mtime) de tous les fichiers sous root."""
+    h = hashlib.sha1()
+    for path in sorted(iter_files(str(root), "")):
+        st = os.stat(path)
+        h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def cache_key() -> Optional[str]:
+    """Clé du cache: état des dépôts sources + contenu de ce script.
+    
+    Commit HEAD pour un clone git, sinon taille/mtime de chaque fichier
+    (copie locale). None si un dépôt manque (extraction sans cache).
+    """
+    parts = []
+    for name, _, _ in REPOS:
+        target = RAW_DIR / name
+        if not (target / ".git").exists():
+            if not target.is_dir():
+                return None
+            parts.append(tree_signature(target))
+            continue
+        ok, out = run_cmd(["git", "-C", str(target), "rev-parse", "HEAD"])
+        if not ok:
+            return None
+        parts.append(out.strip())
+    parts.append(hashlib.sha1(Path(__file__).read_bytes()).hexdigest())
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def load_cache(key: str) -> Optional[Tuple[List[dict], Dict[str, int]]]:
+    path = DATA_DIR / f"parsed_{key}{CACHE_SUFFIX}"
+    if not path.exists():
+        return None
+    try:
+        blob = path.read_bytes()
+        data = zstandard.ZstdDecompressor().decompress(blob) if zstandard else gzip.decompress(blob)
+        return pickle.loads(data)
+    except Exception as e:
+        log(f"Cache illisible ({e}), extraction complète", "warn")
+        return None
+
+
+def save_cache(key: str, entries: List[dict], stats: Dict[str, int]):
+    # Un seul cache à la fois: les précédents ne correspondent plus aux sources
+    for old in DATA_DIR.glob("parsed_*.pkl.*"):
+        old.unlink()
+    data = pickle.dumps((entries, stats), protocol=pickle.HIGHEST_PROTOCOL)
+    blob = zstandard.ZstdCompressor(level=3).compress(data) if zstandard else gzip.compress(data, compresslevel=1)
+    (DATA_DIR / f"parsed_{key}{CACHE_SUFFIX}").write_bytes(blob)
+
 # ============================================================================
 # MAIN
 # ============================================================================
 
-def main():
-    print(f"\n{C.BOLD}{'═' * 60}")
-    print("🎲 PF2e Data Extractor v6 - HTM-Based")
-    print(f"{'═' * 60}{C.RESET}\n")
-    
-    args = sys.argv[1:]
-    if "--clean" in args:
-        if DATA_DIR.exists():
-            shutil.rmtree(DATA_DIR)
-        log("Données supprimées", "ok")
-        print()
-    
-    skip_download = "--local" in args
-    
-    if not skip_download:
-        print(f"{C.BOLD}[1/4] Téléchargement{C.RESET}")
-        results = download_repos()
-        print()
-        if not any(results.values()):
-            log("Aucune source disponible!", "err")
-            return
-    else:
-        log("Mode local", "dim")
-        print()
-    
+def extract_all() -> Tuple[List[dict], Dict[str, int]]:
+    """Étapes 2 et 3: traductions .htm puis données Foundry et annexes."""
     # Charger les traductions depuis les fichiers .htm
     print(f"{C.BOLD}[2/4] Chargement traductions (.htm){C.RESET}")
     translations, journals = load_all_translations()
@@ -1250,43 +1577,81 @@ def main():
     entries, stats = extract_foundry_with_translations(translations, journals)
     
     # Ajouter les pages de journaux (règles, etc.)
-    journal_entries = extract_journal_entries()
-    for je in journal_entries:
+    # Générateur: les entrées sont ajoutées au fil de l'extraction
+    for je in extract_journal_entries():
         entries.append(je)
         pack_type = je.get("_pack_type", "règle")
         stats[pack_type] = stats.get(pack_type, 0) + 1
     
     # Ajouter les traits depuis les fichiers de langue
-    trait_entries = extract_traits()
-    for te in trait_entries:
+    for te in extract_traits():
         entries.append(te)
         stats["trait"] = stats.get("trait", 0) + 1
     
     # Ajouter les capacités NPC (glossaire)
-    npc_ability_entries = extract_npc_abilities()
-    for ae in npc_ability_entries:
+    for ae in extract_npc_abilities():
         entries.append(ae)
         stats["capacité"] = stats.get("capacité", 0) + 1
     
     # Ajouter les états/conditions
-    condition_entries = extract_conditions()
-    for ce in condition_entries:
+    for ce in extract_conditions():
         entries.append(ce)
         stats["état"] = stats.get("état", 0) + 1
     
     # Ajouter les matériaux précieux
-    material_entries = extract_materials()
-    for me in material_entries:
+    for me in extract_materials():
         entries.append(me)
         stats["matériau"] = stats.get("matériau", 0) + 1
     
     # Ajouter le glossaire général
-    glossary_entries = extract_glossary()
-    for ge in glossary_entries:
+    for ge in extract_glossary():
         entries.append(ge)
         stats["glossaire"] = stats.get("glossaire", 0) + 1
     
+    # Les fichiers de langue ne servent plus: libérer la mémoire
+    load_lang.cache_clear()
+    lang_prefix_index.cache_clear()
+    
     print()
+    return entries, stats
+
+
+def main():
+    print(f"\n{C.BOLD}{'═' * 60}")
+    print("🎲 PF2e Data Extractor v6 - HTM-Based")
+    print(f"{'═' * 60}{C.RESET}\n")
+    
+    args = sys.argv[1:]
+    if "--clean" in args:
+        if DATA_DIR.exists():
+            shutil.rmtree(DATA_DIR)
+        log("Données supprimées", "ok")
+        print()
+    
+    skip_download = "--local" in args
+    
+    if not skip_download:
+        print(f"{C.BOLD}[1/4] Téléchargement{C.RESET}")
+        results = download_repos()
+        print()
+        if not any(results.values()):
+            log("Aucune source disponible!", "err")
+            return
+    else:
+        log("Mode local", "dim")
+        print()
+    
+    # Sources inchangées depuis la dernière exécution: pas de re-parsing
+    key = None if "--no-cache" in args else cache_key()
+    cached = load_cache(key) if key else None
+    if cached:
+        entries, stats = cached
+        log(f"Cache d'extraction utilisé ({len(entries)} entrées)", "ok")
+        print()
+    else:
+        entries, stats = extract_all()
+        if key and entries:
+            save_cache(key, entries, stats)
     
     if not entries:
         log("Aucune entrée!", "err")
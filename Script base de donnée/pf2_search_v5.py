@@ -10,6 +10,7 @@ Usage:
     python pf2_search_v5.py "loup" --full      # Avec détails complets
     python pf2_search_v5.py créature:wolf      # Par type
     python pf2_search_v5.py --pack bestiary wolf
+    python pf2_search_v5.py --preload          # Base chargée en mémoire (sessions longues)
 
 Interactif:
     loup              → recherche
@@ -19,6 +20,8 @@ Interactif:
     pack:bestiary loup → filtre par pack
 """
 
+import heapq
+import io
 import json
 import re
 import html
@@ -28,12 +31,28 @@ import textwrap
 import unicodedata
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
-from collections import defaultdict
+from contextlib import redirect_stdout
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson  # Optionnel: décodage JSON en C, nettement plus rapide
+    
+    def json_loads(data):
+        try:
+            return orjson.loads(data)
+        except ValueError:  # Entiers hors 64 bits, NaN: écrits par json.dumps
+            return json.loads(data)
+except ImportError:
+    json_loads = json.loads
 
 DATA_DIR = Path("pf2_data")
 DB_FILE = DATA_DIR / "pf2e_v5.db"
 
 
+# Plus grand que le nombre de noms FR+EN: un parcours complet de la base ne
+# doit pas évincer les entrées avant la recherche suivante
+@lru_cache(maxsize=1 << 17)
 def normalize_text(text: str) -> str:
     """Normalise le texte en retirant les accents."""
     # Décompose les caractères accentués (é -> e + accent)
@@ -66,48 +85,187 @@ if not sys.stdout.isatty():
         if not attr.startswith('_'):
             setattr(C, attr, '')
 
+# Largeur de l'affichage détaillé et séparateurs, construits une fois les couleurs fixées
+WIDTH = 70
+SEP_DOUBLE = f"{C.BLUE}{'═' * WIDTH}{C.RESET}"
+SEP_LINE = f"{C.DIM}{'─' * WIDTH}{C.RESET}"
+# Découpage des paragraphes: descriptions (retrait 3) et capacités (retrait 6)
+DESC_WRAPPER = textwrap.TextWrapper(width=WIDTH - 4, initial_indent="   ", subsequent_indent="   ")
+ITEM_WRAPPER = textwrap.TextWrapper(width=WIDTH - 6, initial_indent="      ", subsequent_indent="      ")
+
+# ============================================================================
+# LIBELLÉS (tables construites une fois, pas à chaque affichage)
+# ============================================================================
+
+RARITY_COLORS = {"uncommon": C.YELLOW, "rare": C.MAGENTA, "unique": C.RED}
+
+ACTION_SYMBOLS = {
+    "1": "◆", "2": "◆◆", "3": "◆◆◆",
+    1: "◆", 2: "◆◆", 3: "◆◆◆",
+    "reaction": "↺", "free": "◇", "passive": "—",
+}
+
+TYPE_LABELS = {
+    "créature": "Créature", "sort": "Sort", "don": "Don", 
+    "action": "Action", "équipement": "Équipement", "arme": "Arme",
+    "armure": "Armure", "consommable": "Consommable", "danger": "Danger",
+    "ascendance": "Ascendance", "héritage": "Héritage", "historique": "Historique",
+    "classe": "Classe", "archétype": "Archétype", "divinité": "Divinité",
+    "état": "État", "effet": "Effet", "compagnon": "Compagnon",
+    "familier": "Familier", "véhicule": "Véhicule", "trésor": "Trésor",
+    "règle": "Règle", "domaine": "Domaine", "trait": "Trait",
+    "capacité": "Capacité", "matériau": "Matériau", "glossaire": "Glossaire",
+}
+
+SIZE_LABELS = {
+    "tiny": "Très petite (TP)",
+    "sm": "Petite (P)",
+    "med": "Moyenne (M)",
+    "lg": "Grande (G)",
+    "huge": "Très grande (TG)",
+    "grg": "Gargantuesque (Gar)"
+}
+
+SKILL_NAMES = {
+    "acrobatics": "Acrobaties", "arcana": "Arcanes", "athletics": "Athlétisme",
+    "crafting": "Artisanat", "deception": "Duperie", "diplomacy": "Diplomatie",
+    "intimidation": "Intimidation", "medicine": "Médecine", "nature": "Nature",
+    "occultism": "Occultisme", "performance": "Représentation", "religion": "Religion",
+    "society": "Société", "stealth": "Discrétion", "survival": "Survie",
+    "thievery": "Vol"
+}
+
+# Ordre d'affichage des caractéristiques (abréviations des blocs de stats)
+ABILITY_ABBREVS = {"str": "For", "dex": "Dex", "con": "Con", "int": "Int", "wis": "Sag", "cha": "Cha"}
+ABILITY_NAMES = {"str": "Force", "dex": "Dextérité", "con": "Constitution", 
+                 "int": "Intelligence", "wis": "Sagesse", "cha": "Charisme"}
+SAVE_NAMES = {"fortitude": "Vigueur", "reflex": "Réflexes", "will": "Volonté"}
+PROFICIENCY_NAMES = {0: "Non formé", 1: "Formé", 2: "Expert", 3: "Maître", 4: "Légendaire"}
+WEAPON_CATEGORIES = {"simple": "Simples", "martial": "Martiales", "advanced": "Avancées", "unarmed": "Sans arme"}
+ARMOR_CATEGORIES = {"unarmored": "Sans armure", "light": "Légère", "medium": "Intermédiaire", "heavy": "Lourde"}
+
+# Traits d'attaques et d'actions, types de dégâts (traduction basique)
+ATTACK_TRAITS = {
+    "unarmed": "mains nues", "finesse": "finesse", "agile": "agile",
+    "reach": "allonge", "thrown": "lancer", "deadly": "mortel",
+    "fatal": "fatal", "forceful": "percutant", "sweep": "balayage",
+    "trip": "croc-en-jambe", "shove": "bousculade", "grapple": "lutte",
+    "knockdown": "renversement", "backstabber": "perfide",
+}
+
+ACTION_TRAITS = {
+    "concentrate": "concentration", "manipulate": "manipulation",
+    "move": "mouvement", "attack": "attaque", "flourish": "épanouissement",
+    "press": "pression", "rage": "rage", "stance": "posture",
+    "visual": "visuel", "auditory": "auditif", "mental": "mental",
+    "emotion": "émotion", "fear": "peur", "linguistic": "linguistique",
+    "incapacitation": "mise hors combat", "death": "mort",
+}
+
+DAMAGE_TYPES = {
+    "piercing": "perforant", "slashing": "tranchant", "bludgeoning": "contondant",
+    "fire": "feu", "cold": "froid", "electricity": "électricité",
+    "acid": "acide", "poison": "poison", "mental": "mental",
+    "force": "force", "sonic": "son", "bleed": "saignement",
+    "positive": "positif", "negative": "négatif", "spirit": "esprit",
+    "vitality": "vitalité", "void": "néant",
+}
+
+# Progression de classe : (clé système, libellé), dans l'ordre d'affichage
+PROGRESSION_LABELS = (
+    ("ancestryFeatLevels", "Dons d'ascendance"),
+    ("classFeatLevels", "Dons de classe"),
+    ("generalFeatLevels", "Dons généraux"),
+    ("skillFeatLevels", "Dons de compétence"),
+    ("skillIncreaseLevels", "Augm. compétences"),
+)
+
+# En-têtes d'attaque déjà colorés (C est fixé plus haut)
+ATTACK_LABELS = {
+    "melee": f"   {C.ORANGE}Corps-à-corps{C.RESET}",
+    "ranged": f"   {C.ORANGE}À distance{C.RESET}",
+}
+
+# Types d'items de créature repris dans la fiche détaillée
+CREATURE_ITEM_TYPES = frozenset(("melee", "ranged", "action", "spellcastingEntry"))
+
 # ============================================================================
 # UTILITAIRES
 # ============================================================================
 
+# Balises HTML: une alternative nommée par remplacement, plusieurs balises par passe
+HTML_TAG_REPL = {
+    "bold": C.BOLD, "reset": C.RESET, "drop": "", "nl": "\n", "para": "\n\n",
+    "rule": "\n" + "─" * 50 + "\n", "bullet": "  • ",
+}
+# Mise en forme en ligne (avant les paragraphes: </p><br><p> reste un saut de paragraphe)
+RE_HTML_INLINE = re.compile(r'(?P<bold><(?:strong|b)>)|(?P<reset></(?:strong|b)>)'
+                            r'|(?P<drop></?(?:em|i)>)|(?P<nl><br\s*/?>)')
+# Blocs: paragraphes, séparateurs, listes
+RE_HTML_BLOCK = re.compile(r'(?P<para></p>\s*<p[^>]*>)|(?P<nl></p>|</li>)|(?P<rule><hr[^>]*>)'
+                           r'|(?P<bullet><li[^>]*>)|(?P<drop><p[^>]*>|<ul[^>]*>|</ul>)')
+RE_HTML_HEADING = re.compile(r'<h\d[^>]*>([^<]*)</h\d>')
+# Références Foundry: @UUID[Compendium....]{Texte}, @Compendium[...]{Texte}, @Check, @Damage, [[/r ...]]
+RE_FOUNDRY_REF = re.compile(r'@(?:UUID\[Compendium\.|Compendium\[)[^\]]+\]\{(?P<link>[^}]+)\}'
+                            r'|@Check\[(?P<check>[^\]|]+)[^\]]*\]'
+                            r'|@Damage\[(?P<damage>[^\]]+)\](?:\{[^}]+\})?'
+                            r'|\[\[/r(?:oll)?\s*(?P<roll>[^\]#\]]+)[^\]]*\]\](?:\{[^}]+\})?')
+RE_HTML_TAG = re.compile(r'<[^>]+>')
+RE_BLANK_LINES = re.compile(r'\n{3,}')
+
+def html_tag_repl(match) -> str:
+    return HTML_TAG_REPL[match.lastgroup]
+
+def foundry_ref_repl(match) -> str:
+    name = match.lastgroup
+    if name == "link":
+        # Le texte du lien peut lui-même contenir un @Check, etc.
+        return "⟨" + RE_FOUNDRY_REF.sub(foundry_ref_repl, match.group(name)) + "⟩"
+    return "[" + match.group(name) + "]"
+
+# Mêmes descriptions (capacités communes, traits) d'une entrée à l'autre
+@lru_cache(maxsize=4096)
 def clean_html(text: str) -> str:
     """Nettoie le HTML pour affichage terminal."""
     if not text:
         return ""
     
     text = html.unescape(text)
-    text = re.sub(r'<strong>|<b>', C.BOLD, text)
-    text = re.sub(r'</strong>|</b>', C.RESET, text)
-    text = re.sub(r'<em>|<i>', '', text)
-    text = re.sub(r'</em>|</i>', '', text)
-    text = re.sub(r'<br\s*/?>', '\n', text)
-    text = re.sub(r'</p>\s*<p[^>]*>', '\n\n', text)
-    text = re.sub(r'<p[^>]*>', '', text)
-    text = re.sub(r'</p>', '\n', text)
-    text = re.sub(r'<hr[^>]*>', '\n' + '─' * 50 + '\n', text)
-    text = re.sub(r'<li[^>]*>', '  • ', text)
-    text = re.sub(r'</li>', '\n', text)
-    text = re.sub(r'<ul[^>]*>|</ul>', '', text)
-    text = re.sub(r'<h\d[^>]*>([^<]*)</h\d>', r'\n\1\n', text)
-    # Références Foundry
-    text = re.sub(r'@UUID\[Compendium\.[^\]]+\]\{([^}]+)\}', r'⟨\1⟩', text)
-    text = re.sub(r'@Compendium\[[^\]]+\]\{([^}]+)\}', r'⟨\1⟩', text)
-    text = re.sub(r'@Check\[([^\]|]+)[^\]]*\]', r'[\1]', text)
-    text = re.sub(r'@Damage\[([^\]]+)\](\{[^}]+\})?', r'[\1]', text)
-    text = re.sub(r'\[\[/r(?:oll)?\s*([^\]#\]]+)[^\]]*\]\](\{[^}]+\})?', r'[\1]', text)
-    text = re.sub(r'<span[^>]*>|</span>', '', text)
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = RE_HTML_INLINE.sub(html_tag_repl, text)
+    text = RE_HTML_BLOCK.sub(html_tag_repl, text)
+    text = RE_HTML_HEADING.sub(r'\n\1\n', text)
+    text = RE_FOUNDRY_REF.sub(foundry_ref_repl, text)
+    text = RE_HTML_TAG.sub('', text)  # Balises restantes (span, table...)
+    text = RE_BLANK_LINES.sub('\n\n', text)
     return text.strip()
 
+def dig(data, *keys, default=None):
+    """data[k1][k2]... sans dict vide intermédiaire; default si un niveau manque."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
 def format_mod(val) -> str:
     """Formate un modificateur avec signe."""
+    try:
+        return format_scalar_mod(val)
+    except TypeError:
+        # Valeur non hachable (liste, dict): pas de conversion possible
+        return str(val)
+
+@lru_cache(maxsize=256, typed=True)
+def format_scalar_mod(val) -> str:
+    """format_mod pour une valeur hachable (mémoïsé: bonus et DD se répètent)."""
     if val is None:
         return "?"
     try:
         v = int(val)
         return f"+{v}" if v >= 0 else str(v)
-    except:
+    except (TypeError, ValueError, OverflowError):  # Texte, objet, infini
         return str(val)
 
 def format_traits(traits: list, rarity: str = None) -> str:
@@ -116,34 +274,31 @@ def format_traits(traits: list, rarity: str = None) -> str:
         return ""
     
     parts = []
-    rarity_colors = {"uncommon": C.YELLOW, "rare": C.MAGENTA, "unique": C.RED}
     
     if rarity and rarity.lower() not in ["common", ""]:
-        color = rarity_colors.get(rarity.lower(), C.CYAN)
+        color = RARITY_COLORS.get(rarity.lower(), C.CYAN)
         parts.append(f"{color}[{rarity}]{C.RESET}")
     
     for trait in (traits or []):
         t = trait.get("value", trait) if isinstance(trait, dict) else str(trait)
-        if t.lower() not in rarity_colors:
+        if t.lower() not in RARITY_COLORS:
             parts.append(f"{C.CYAN}[{t}]{C.RESET}")
     
     return " ".join(parts)
 
 def format_actions(actions) -> str:
     """Symboles d'actions."""
-    if actions is None:
-        return ""
-    
-    mapping = {
-        "1": "◆", "2": "◆◆", "3": "◆◆◆",
-        1: "◆", 2: "◆◆", 3: "◆◆◆",
-        "reaction": "↺", "free": "◇", "passive": "—",
-    }
-    
     if isinstance(actions, dict):
         actions = actions.get("value")
     
-    return mapping.get(actions, str(actions) if actions else "")
+    return action_symbols(actions)
+
+@lru_cache(maxsize=32, typed=True)
+def action_symbols(actions) -> str:
+    """Symboles pour une valeur d'actions brute (mémoïsé)."""
+    if actions is None:
+        return ""
+    return ACTION_SYMBOLS.get(actions, str(actions) if actions else "")
 
 # ============================================================================
 # EXTRACTION DONNÉES
@@ -261,7 +416,40 @@ def display_compact(entry: dict, idx: int):
 # AFFICHAGE COMPLET (détails)
 # ============================================================================
 
+def has_trait(traits: list, target: str) -> bool:
+    """Vrai si un trait (chaîne ou dict {"value": ...}) vaut target, sans tenir compte de la casse."""
+    for t in traits:
+        value = t if isinstance(t, str) else t.get("value", "")
+        if value.lower() == target:
+            return True
+    return False
+
+def write_out(text: str):
+    """Écrit un bloc de texte en une fois, encodé directement en octets."""
+    out = sys.stdout
+    raw = getattr(out, "buffer", None)
+    if raw is None:
+        # Flux texte sans tampon binaire (redirection Python, IDE...)
+        out.write(text)
+    else:
+        # Même encodage et même gestion d'erreurs que print()
+        out.flush()
+        raw.write(text.encode(out.encoding or "utf-8", out.errors or "strict"))
+    out.flush()
+
 def display_full(entry: dict):
+    """Affiche TOUS les détails d'une entrée, en une seule écriture."""
+    # Les display_*_full font des dizaines de print(): sur un terminal
+    # (ligne par ligne), autant d'appels système sans ce tampon
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            display_full_body(entry)
+    finally:
+        # Même en cas d'erreur, ce qui a déjà été rendu est affiché
+        write_out(buf.getvalue())
+
+def display_full_body(entry: dict):
     """Affiche TOUS les détails d'une entrée."""
     name_fr = entry.get("name_fr", entry.get("name", ""))
     name_en = entry.get("name_en", "")
@@ -275,32 +463,19 @@ def display_full(entry: dict):
     source = entry.get("_source", "")
     items = entry.get("items", [])
     
-    w = 70  # Largeur
-    
-    # Mapping des types pour l'affichage
-    type_display = {
-        "créature": "Créature", "sort": "Sort", "don": "Don", 
-        "action": "Action", "équipement": "Équipement", "arme": "Arme",
-        "armure": "Armure", "consommable": "Consommable", "danger": "Danger",
-        "ascendance": "Ascendance", "héritage": "Héritage", "historique": "Historique",
-        "classe": "Classe", "archétype": "Archétype", "divinité": "Divinité",
-        "état": "État", "effet": "Effet", "compagnon": "Compagnon",
-        "familier": "Familier", "véhicule": "Véhicule", "trésor": "Trésor",
-        "règle": "Règle", "domaine": "Domaine", "trait": "Trait",
-        "capacité": "Capacité", "matériau": "Matériau", "glossaire": "Glossaire",
-    }
-    type_label = type_display.get(pack_type, pack_type.capitalize() if pack_type else "")
+    w = WIDTH  # Largeur (celle de SEP_DOUBLE / SEP_LINE)
+    
+    type_label = TYPE_LABELS.get(pack_type) or (pack_type.capitalize() if pack_type else "")
     
     # Pour les sorts, distinguer cantrip / focus / sort normal
     if pack_type == "sort":
-        trait_values = [t.lower() if isinstance(t, str) else t.get("value", "").lower() for t in traits]
-        if "cantrip" in trait_values:
+        if has_trait(traits, "cantrip"):
             type_label = "Tour de magie"
-        elif "focus" in trait_values:
+        elif has_trait(traits, "focus"):
             type_label = "Sort focalisé"
     
     print()
-    print(f"{C.BLUE}{'═' * w}{C.RESET}")
+    print(SEP_DOUBLE)
     
     # === TITRE ===
     title = f" {name_fr.upper()} "
@@ -322,51 +497,37 @@ def display_full(entry: dict):
     # === MÉTADONNÉES ===
     print(f"   {C.DIM}Pack: {pack} | UUID: {entry_id} | Source: {source}{C.RESET}")
     
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # === DESCRIPTION ===
     if desc:
         desc_clean = clean_html(desc)
         for para in desc_clean.split('\n'):
             if para.strip():
-                wrapped = textwrap.fill(para, width=w-4, initial_indent="   ", subsequent_indent="   ")
+                wrapped = DESC_WRAPPER.fill(para)
                 print(wrapped)
         print()
     
     # === STATS SELON LE TYPE ===
-    if pack_type == "créature":
-        display_creature_full(system, items, w)
-    elif pack_type == "sort":
-        display_spell_full(system, w)
-    elif pack_type == "don":
-        display_feat_full(system, w)
-    elif pack_type in ["équipement", "arme", "armure", "consommable"]:
-        display_equipment_full(system, w)
-    elif pack_type == "action":
-        display_action_full(system, w)
-    elif pack_type == "compagnon":
-        display_creature_full(system, items, w)
-    elif pack_type == "classe":
-        display_class_full(system, items, w)
-    
-    print(f"{C.BLUE}{'═' * w}{C.RESET}")
+    display_type = FULL_DISPLAYS.get(pack_type)
+    if display_type:
+        display_type(system, items, w)
+    
+    print(SEP_DOUBLE)
+
+@lru_cache(maxsize=1024)
+def split_senses(value: str) -> Tuple[str, ...]:
+    """Découpe une liste de sens séparés par des virgules (mémoïsé)."""
+    return tuple(s for s in (part.strip() for part in value.split(",")) if s)
 
 def display_creature_full(system: dict, items: list, w: int):
     """Stats complètes d'une créature."""
     
     # === TAILLE ===
-    size_map = {
-        "tiny": "Très petite (TP)",
-        "sm": "Petite (P)",
-        "med": "Moyenne (M)",
-        "lg": "Grande (G)",
-        "huge": "Très grande (TG)",
-        "grg": "Gargantuesque (Gar)"
-    }
     traits = system.get("traits", {})
-    size_value = traits.get("size", {}).get("value", "") if isinstance(traits, dict) else ""
+    size_value = dig(traits, "size", "value", default="") if isinstance(traits, dict) else ""
     if size_value:
-        size_label = size_map.get(size_value, size_value.capitalize())
+        size_label = SIZE_LABELS.get(size_value) or size_value.capitalize()
         print(f"   {C.GREEN}Taille{C.RESET} {size_label}")
     
     # === PERCEPTION & SENS ===
@@ -390,9 +551,8 @@ def display_creature_full(system: dict, items: list, w: int):
         # Senses depuis traits
         traits = system.get("traits", {})
         if isinstance(traits, dict):
-            for s in traits.get("senses", {}).get("value", "").split(","):
-                s = s.strip()
-                if s and s not in senses:
+            for s in split_senses(dig(traits, "senses", "value", default="")):
+                if s not in senses:
                     senses.append(s)
         
         print(f"   {C.GREEN}Perception{C.RESET} {format_mod(val)}", end="")
@@ -402,7 +562,7 @@ def display_creature_full(system: dict, items: list, w: int):
             print()
     
     # === LANGUES ===
-    languages = system.get("details", {}).get("languages", {})
+    languages = dig(system, "details", "languages", default={})
     if languages:
         langs = languages.get("value", [])
         if langs:
@@ -412,17 +572,9 @@ def display_creature_full(system: dict, items: list, w: int):
     skills = system.get("skills", {})
     if skills:
         skill_strs = []
-        skill_names = {
-            "acrobatics": "Acrobaties", "arcana": "Arcanes", "athletics": "Athlétisme",
-            "crafting": "Artisanat", "deception": "Duperie", "diplomacy": "Diplomatie",
-            "intimidation": "Intimidation", "medicine": "Médecine", "nature": "Nature",
-            "occultism": "Occultisme", "performance": "Représentation", "religion": "Religion",
-            "society": "Société", "stealth": "Discrétion", "survival": "Survie",
-            "thievery": "Vol"
-        }
         for k, v in skills.items():
             if isinstance(v, dict) and v.get("base", 0) != 0:
-                name = skill_names.get(k, k.capitalize())
+                name = SKILL_NAMES.get(k) or k.capitalize()
                 skill_strs.append(f"{name} {format_mod(v.get('base', 0))}")
         if skill_strs:
             print(f"   {C.GREEN}Compétences{C.RESET} {', '.join(skill_strs)}")
@@ -431,15 +583,15 @@ def display_creature_full(system: dict, items: list, w: int):
     abilities = system.get("abilities", {})
     if abilities:
         ab_strs = []
-        names = {"str": "For", "dex": "Dex", "con": "Con", "int": "Int", "wis": "Sag", "cha": "Cha"}
-        for ab in ["str", "dex", "con", "int", "wis", "cha"]:
-            if ab in abilities:
-                mod = abilities[ab].get("mod", 0)
-                ab_strs.append(f"{C.BOLD}{names[ab]}{C.RESET} {format_mod(mod)}")
+        for ab, abbrev in ABILITY_ABBREVS.items():
+            ability = abilities.get(ab)
+            if ability is not None:
+                mod = ability.get("mod", 0)
+                ab_strs.append(f"{C.BOLD}{abbrev}{C.RESET} {format_mod(mod)}")
         if ab_strs:
             print(f"   {', '.join(ab_strs)}")
     
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # === DÉFENSES ===
     attributes = system.get("attributes", {})
@@ -459,10 +611,10 @@ def display_creature_full(system: dict, items: list, w: int):
     saves = system.get("saves", {})
     if saves:
         save_strs = []
-        names = {"fortitude": "Vigueur", "reflex": "Réflexes", "will": "Volonté"}
-        for k, n in names.items():
-            if k in saves:
-                val = saves[k].get("value", 0)
+        for k, n in SAVE_NAMES.items():
+            save = saves.get(k)
+            if save is not None:
+                val = save.get("value", 0)
                 save_strs.append(f"{C.BOLD}{n}{C.RESET} {format_mod(val)}")
         if save_strs:
             print(f"   {'; '.join(save_strs)}")
@@ -506,7 +658,7 @@ def display_creature_full(system: dict, items: list, w: int):
         if weak_strs:
             print(f"   {C.GREEN}Faiblesses{C.RESET} {', '.join(weak_strs)}")
     
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # === VITESSE ===
     speed = attributes.get("speed", {})
@@ -532,35 +684,36 @@ def display_creature_full(system: dict, items: list, w: int):
     passives = []
     spellcasting = []
     
+    # Une seule passe : on ignore d'emblée les types non affichés
     for item in items:
         if not isinstance(item, dict):
             continue
         
         item_type = item.get("type", "")
-        item_name = item.get("name_fr") or item.get("name", "")
-        item_system = item.get("system", {})
+        if item_type not in CREATURE_ITEM_TYPES:
+            continue
         
-        if item_type in ["melee", "ranged"]:
-            attacks.append(parse_attack(item, item_type))
-        elif item_type == "action":
+        if item_type == "action":
+            item_system = item.get("system", {})
             action_cat = item_system.get("category", "")
             if action_cat == "offensive":
-                actions_list.append(parse_action(item))
+                bucket = actions_list
             elif action_cat == "defensive":
-                passives.append(parse_action(item))
+                bucket = passives
             else:
                 # Par défaut
-                if item_system.get("actions", {}).get("value"):
-                    actions_list.append(parse_action(item))
-                else:
-                    passives.append(parse_action(item))
+                bucket = actions_list if dig(item_system, "actions", "value") else passives
+            bucket.append(parse_action(item))
         elif item_type == "spellcastingEntry":
-            spellcasting.append(parse_spellcasting(item_name, item_system))
+            item_name = item.get("name_fr") or item.get("name", "")
+            spellcasting.append(parse_spellcasting(item_name, item.get("system", {})))
+        else:
+            attacks.append(parse_attack(item, item_type))
     
     # Afficher attaques
     if attacks:
         for atk in attacks:
-            print(f"   {C.ORANGE}Corps-à-corps{C.RESET}" if atk['type'] == 'melee' else f"   {C.ORANGE}À distance{C.RESET}", end="")
+            print(atk['label'], end="")
             print(f" {format_actions(1)} {C.BOLD}{atk['name']}{C.RESET} {format_mod(atk['bonus'])}", end="")
             if atk['traits']:
                 print(f" ({', '.join(atk['traits'])})", end="")
@@ -583,7 +736,7 @@ def display_creature_full(system: dict, items: list, w: int):
                 desc = clean_html(p['description'])
                 if len(desc) > 200:
                     desc = desc[:197] + "..."
-                wrapped = textwrap.fill(desc, width=w-6, initial_indent="      ", subsequent_indent="      ")
+                wrapped = ITEM_WRAPPER.fill(desc)
                 print(f"{C.DIM}{wrapped}{C.RESET}")
     
     # Afficher actions offensives
@@ -603,51 +756,35 @@ def display_creature_full(system: dict, items: list, w: int):
                 print(f"      {C.GREEN}Conditions{C.RESET} {clean_html(a['requirements'])}")
             if a['description']:
                 desc = clean_html(a['description'])
-                wrapped = textwrap.fill(desc, width=w-6, initial_indent="      ", subsequent_indent="      ")
+                wrapped = ITEM_WRAPPER.fill(desc)
                 print(f"{wrapped}")
 
+def damage_type_fr(dtype: str) -> str:
+    """Traduit un type de dégâts."""
+    return DAMAGE_TYPES.get(dtype.lower(), dtype)
+
 def parse_attack(item: dict, atk_type: str) -> dict:
     """Parse une attaque."""
     system = item.get("system", {})
-    bonus = system.get("bonus", {}).get("value", 0)
+    bonus = dig(system, "bonus", "value", default=0)
     
     # Nom FR si disponible
     name = item.get("name_fr") or item.get("name", "")
     
     # Traits avec traduction basique
-    traits = []
-    trait_map = {
-        "unarmed": "mains nues", "finesse": "finesse", "agile": "agile",
-        "reach": "allonge", "thrown": "lancer", "deadly": "mortel",
-        "fatal": "fatal", "forceful": "percutant", "sweep": "balayage",
-        "trip": "croc-en-jambe", "shove": "bousculade", "grapple": "lutte",
-        "knockdown": "renversement", "backstabber": "perfide",
-    }
-    for t in system.get("traits", {}).get("value", []):
-        traits.append(trait_map.get(t.lower(), t))
-    
-    # Dégâts avec traduction des types
-    damage_rolls = system.get("damageRolls", {})
-    dmg_parts = []
-    dmg_type_map = {
-        "piercing": "perforant", "slashing": "tranchant", "bludgeoning": "contondant",
-        "fire": "feu", "cold": "froid", "electricity": "électricité",
-        "acid": "acide", "poison": "poison", "mental": "mental",
-        "force": "force", "sonic": "son", "bleed": "saignement",
-        "positive": "positif", "negative": "négatif", "spirit": "esprit",
-        "vitality": "vitalité", "void": "néant",
-    }
-    for dmg in damage_rolls.values():
-        if isinstance(dmg, dict):
-            dice = dmg.get("damage", "")
-            dtype = dmg.get("damageType", "")
-            dtype_fr = dmg_type_map.get(dtype.lower(), dtype)
-            if dice:
-                dmg_parts.append(f"{dice} {dtype_fr}")
+    traits = [ATTACK_TRAITS.get(t.lower(), t) for t in dig(system, "traits", "value", default=())]
+    
+    # Dégâts avec traduction des types (entrées sans dés ignorées d'emblée)
+    dmg_parts = [
+        f"{dmg['damage']} {damage_type_fr(dmg.get('damageType', ''))}"
+        for dmg in system.get("damageRolls", {}).values()
+        if isinstance(dmg, dict) and dmg.get("damage")
+    ]
     
     return {
         "name": name,
         "type": atk_type,
+        "label": ATTACK_LABELS[atk_type],
         "bonus": bonus,
         "traits": traits,
         "damage": " plus ".join(dmg_parts)
@@ -660,20 +797,12 @@ def parse_action(item: dict) -> dict:
     # Nom FR si disponible
     name = item.get("name_fr") or item.get("name", "")
     
-    actions = system.get("actions", {}).get("value")
+    actions = dig(system, "actions", "value")
     
     # Traits avec traduction
     traits = []
-    trait_map = {
-        "concentrate": "concentration", "manipulate": "manipulation",
-        "move": "mouvement", "attack": "attaque", "flourish": "épanouissement",
-        "press": "pression", "rage": "rage", "stance": "posture",
-        "visual": "visuel", "auditory": "auditif", "mental": "mental",
-        "emotion": "émotion", "fear": "peur", "linguistic": "linguistique",
-        "incapacitation": "mise hors combat", "death": "mort",
-    }
-    for t in system.get("traits", {}).get("value", []):
-        traits.append(trait_map.get(t.lower(), t))
+    for t in dig(system, "traits", "value", default=()):
+        traits.append(ACTION_TRAITS.get(t.lower(), t))
     
     # Description FR si disponible
     desc = item.get("description_fr") or ""
@@ -689,39 +818,40 @@ def parse_action(item: dict) -> dict:
         "actions": actions,
         "traits": traits,
         "description": desc,
-        "trigger": system.get("trigger", {}).get("value", ""),
+        "trigger": dig(system, "trigger", "value", default=""),
         "requirements": system.get("requirements", ""),
     }
 
 def parse_spellcasting(name: str, system: dict) -> dict:
     """Parse une entrée d'incantation."""
+    spelldc = system.get("spelldc", {})
     return {
         "name": name,
-        "tradition": system.get("tradition", {}).get("value", ""),
-        "spelldc": system.get("spelldc", {}).get("dc", ""),
-        "attack": system.get("spelldc", {}).get("value", ""),
+        "tradition": dig(system, "tradition", "value", default=""),
+        "spelldc": dig(spelldc, "dc", default=""),
+        "attack": dig(spelldc, "value", default=""),
     }
 
 def display_spell_full(system: dict, w: int):
     """Stats complètes d'un sort."""
     # Niveau
-    level = system.get("level", {}).get("value", "?")
+    level = dig(system, "level", "value", default="?")
     print(f"   {C.GREEN}Niveau{C.RESET} {level}")
     
     # Traditions
-    traditions = system.get("traditions", {}).get("value", [])
+    traditions = dig(system, "traditions", "value", default=())
     if traditions:
         print(f"   {C.GREEN}Traditions{C.RESET} {', '.join(traditions)}")
     
     # Traits
-    traits = system.get("traits", {}).get("value", [])
+    traits = dig(system, "traits", "value", default=())
     if traits:
         print(f"   {C.GREEN}Traits{C.RESET} {', '.join(traits)}")
     
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # Incantation
-    time = system.get("time", {}).get("value")
+    time = dig(system, "time", "value")
     if time:
         print(f"   {C.GREEN}Incantation{C.RESET} {format_actions(time)}")
     
@@ -733,7 +863,7 @@ def display_spell_full(system: dict, w: int):
             print(f"   {C.GREEN}Composantes{C.RESET} {', '.join(comp_list)}")
     
     # Portée, zone, cibles
-    range_val = system.get("range", {}).get("value", "")
+    range_val = dig(system, "range", "value", default="")
     if range_val:
         print(f"   {C.GREEN}Portée{C.RESET} {range_val}")
     
@@ -741,7 +871,7 @@ def display_spell_full(system: dict, w: int):
     if area and area.get("value"):
         print(f"   {C.GREEN}Zone{C.RESET} {area.get('type', '')} de {area.get('value', '')} m")
     
-    targets = system.get("target", {}).get("value", "")
+    targets = dig(system, "target", "value", default="")
     if targets:
         print(f"   {C.GREEN}Cibles{C.RESET} {targets}")
     
@@ -754,7 +884,7 @@ def display_spell_full(system: dict, w: int):
             print(f"   {C.GREEN}Jet de sauvegarde{C.RESET} {save_type} {basic}")
     
     # Durée
-    duration = system.get("duration", {}).get("value", "")
+    duration = dig(system, "duration", "value", default="")
     if duration:
         print(f"   {C.GREEN}Durée{C.RESET} {duration}")
     
@@ -763,27 +893,27 @@ def display_spell_full(system: dict, w: int):
 def display_feat_full(system: dict, w: int):
     """Stats complètes d'un don."""
     # Niveau
-    level = system.get("level", {}).get("value", "?")
+    level = dig(system, "level", "value", default="?")
     print(f"   {C.GREEN}Niveau{C.RESET} {level}")
     
     # Actions
-    actions = system.get("actions", {}).get("value")
+    actions = dig(system, "actions", "value")
     if actions:
         print(f"   {C.GREEN}Actions{C.RESET} {format_actions(actions)}")
     
     # Traits
-    traits = system.get("traits", {}).get("value", [])
+    traits = dig(system, "traits", "value", default=())
     if traits:
         print(f"   {C.GREEN}Traits{C.RESET} {', '.join(traits)}")
     
     # Prérequis
-    prereqs = system.get("prerequisites", {}).get("value", [])
+    prereqs = dig(system, "prerequisites", "value", default=())
     if prereqs:
         pstrs = [p.get("value", str(p)) if isinstance(p, dict) else str(p) for p in prereqs]
         print(f"   {C.GREEN}Prérequis{C.RESET} {'; '.join(pstrs)}")
     
     # Trigger/Requirements
-    trigger = system.get("trigger", {}).get("value", "")
+    trigger = dig(system, "trigger", "value", default="")
     if trigger:
         print(f"   {C.GREEN}Déclencheur{C.RESET} {trigger}")
     
@@ -796,24 +926,24 @@ def display_feat_full(system: dict, w: int):
 def display_equipment_full(system: dict, w: int):
     """Stats équipement."""
     # Prix
-    price = system.get("price", {}).get("value", {})
+    price = dig(system, "price", "value", default={})
     if isinstance(price, dict):
         parts = [f"{v} {k}" for k, v in price.items() if v]
         if parts:
             print(f"   {C.GREEN}Prix{C.RESET} {', '.join(parts)}")
     
     # Niveau
-    level = system.get("level", {}).get("value")
+    level = dig(system, "level", "value")
     if level:
         print(f"   {C.GREEN}Niveau{C.RESET} {level}")
     
     # Encombrement
-    bulk = system.get("bulk", {}).get("value", "")
+    bulk = dig(system, "bulk", "value", default="")
     if bulk:
         print(f"   {C.GREEN}Encombrement{C.RESET} {bulk}")
     
     # Traits
-    traits = system.get("traits", {}).get("value", [])
+    traits = dig(system, "traits", "value", default=())
     if traits:
         print(f"   {C.GREEN}Traits{C.RESET} {', '.join(traits)}")
     
@@ -856,15 +986,15 @@ def display_equipment_full(system: dict, w: int):
 
 def display_action_full(system: dict, w: int):
     """Stats action."""
-    actions = system.get("actions", {}).get("value")
+    actions = dig(system, "actions", "value")
     if actions:
         print(f"   {C.GREEN}Actions{C.RESET} {format_actions(actions)}")
     
-    traits = system.get("traits", {}).get("value", [])
+    traits = dig(system, "traits", "value", default=())
     if traits:
         print(f"   {C.GREEN}Traits{C.RESET} {', '.join(traits)}")
     
-    trigger = system.get("trigger", {}).get("value", "")
+    trigger = dig(system, "trigger", "value", default="")
     if trigger:
         print(f"   {C.GREEN}Déclencheur{C.RESET} {trigger}")
     
@@ -877,52 +1007,38 @@ def display_action_full(system: dict, w: int):
 def display_class_full(system: dict, items: list, w: int):
     """Stats complètes d'une classe."""
     
-    # Traductions
-    ability_names = {"str": "Force", "dex": "Dextérité", "con": "Constitution", 
-                     "int": "Intelligence", "wis": "Sagesse", "cha": "Charisme"}
-    proficiency_names = {0: "Non formé", 1: "Formé", 2: "Expert", 3: "Maître", 4: "Légendaire"}
-    
     # === STATS DE BASE ===
     hp = system.get("hp", 0)
     print(f"   {C.GREEN}Points de vie{C.RESET} {hp} + modificateur de Constitution par niveau")
     
     # Caractéristique clé
-    key_abilities = system.get("keyAbility", {}).get("value", [])
+    key_abilities = dig(system, "keyAbility", "value", default=())
     if key_abilities:
-        key_names = [ability_names.get(a, a.upper()) for a in key_abilities]
+        key_names = [ABILITY_NAMES.get(a, a.upper()) for a in key_abilities]
         print(f"   {C.GREEN}Caractéristique clé{C.RESET} {' ou '.join(key_names)}")
     
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # === MAÎTRISES INITIALES ===
     print(f"   {C.BOLD}Maîtrises initiales{C.RESET}")
     
     # Perception
     perception = system.get("perception", 0)
-    print(f"   {C.GREEN}Perception{C.RESET} {proficiency_names.get(perception, '?')}")
+    print(f"   {C.GREEN}Perception{C.RESET} {PROFICIENCY_NAMES.get(perception, '?')}")
     
     # Sauvegardes
     saves = system.get("savingThrows", {})
     save_strs = []
-    save_names = {"fortitude": "Vigueur", "reflex": "Réflexes", "will": "Volonté"}
-    for key, name in save_names.items():
+    for key, name in SAVE_NAMES.items():
         rank = saves.get(key, 0)
-        save_strs.append(f"{name} ({proficiency_names.get(rank, '?')})")
+        save_strs.append(f"{name} ({PROFICIENCY_NAMES.get(rank, '?')})")
     print(f"   {C.GREEN}Jets de sauvegarde{C.RESET} {', '.join(save_strs)}")
     
     # Compétences
     trained_skills = system.get("trainedSkills", {})
     skill_list = trained_skills.get("value", [])
     additional = trained_skills.get("additional", 0)
-    skill_names_map = {
-        "acrobatics": "Acrobaties", "arcana": "Arcanes", "athletics": "Athlétisme",
-        "crafting": "Artisanat", "deception": "Duperie", "diplomacy": "Diplomatie",
-        "intimidation": "Intimidation", "medicine": "Médecine", "nature": "Nature",
-        "occultism": "Occultisme", "performance": "Représentation", "religion": "Religion",
-        "society": "Société", "stealth": "Discrétion", "survival": "Survie",
-        "thievery": "Vol"
-    }
-    skill_strs = [skill_names_map.get(s, s.capitalize()) for s in skill_list]
+    skill_strs = [SKILL_NAMES.get(s) or s.capitalize() for s in skill_list]
     if additional:
         skill_strs.append(f"+{additional} au choix")
     print(f"   {C.GREEN}Compétences{C.RESET} {', '.join(skill_strs) if skill_strs else 'Aucune'}")
@@ -930,66 +1046,50 @@ def display_class_full(system: dict, items: list, w: int):
     # Attaques
     attacks = system.get("attacks", {})
     atk_strs = []
-    atk_names = {"simple": "Simples", "martial": "Martiales", "advanced": "Avancées", "unarmed": "Sans arme"}
-    for key, name in atk_names.items():
+    for key, name in WEAPON_CATEGORIES.items():
         rank = attacks.get(key, 0)
         if rank > 0:
-            atk_strs.append(f"{name} ({proficiency_names.get(rank, '?')})")
+            atk_strs.append(f"{name} ({PROFICIENCY_NAMES.get(rank, '?')})")
     if atk_strs:
         print(f"   {C.GREEN}Attaques{C.RESET} {', '.join(atk_strs)}")
     
     # Défenses
     defenses = system.get("defenses", {})
     def_strs = []
-    def_names = {"unarmored": "Sans armure", "light": "Légère", "medium": "Intermédiaire", "heavy": "Lourde"}
-    for key, name in def_names.items():
+    for key, name in ARMOR_CATEGORIES.items():
         rank = defenses.get(key, 0)
         if rank > 0:
-            def_strs.append(f"{name} ({proficiency_names.get(rank, '?')})")
+            def_strs.append(f"{name} ({PROFICIENCY_NAMES.get(rank, '?')})")
     if def_strs:
         print(f"   {C.GREEN}Défenses{C.RESET} {', '.join(def_strs)}")
     
     # Incantation
     spellcasting = system.get("spellcasting", 0)
     if spellcasting:
-        print(f"   {C.GREEN}Incantation{C.RESET} {proficiency_names.get(spellcasting, '?')}")
+        print(f"   {C.GREEN}Incantation{C.RESET} {PROFICIENCY_NAMES.get(spellcasting, '?')}")
     
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # === PROGRESSION ===
     print(f"   {C.BOLD}Progression{C.RESET}")
     
-    ancestry_feats = system.get("ancestryFeatLevels", {}).get("value", [])
-    if ancestry_feats:
-        print(f"   {C.GREEN}Dons d'ascendance{C.RESET} Niv. {', '.join(map(str, ancestry_feats))}")
+    for key, label in PROGRESSION_LABELS:
+        levels = dig(system, key, "value", default=())
+        if levels:
+            print(f"   {C.GREEN}{label}{C.RESET} Niv. {', '.join(map(str, levels))}")
     
-    class_feats = system.get("classFeatLevels", {}).get("value", [])
-    if class_feats:
-        print(f"   {C.GREEN}Dons de classe{C.RESET} Niv. {', '.join(map(str, class_feats))}")
-    
-    general_feats = system.get("generalFeatLevels", {}).get("value", [])
-    if general_feats:
-        print(f"   {C.GREEN}Dons généraux{C.RESET} Niv. {', '.join(map(str, general_feats))}")
-    
-    skill_feats = system.get("skillFeatLevels", {}).get("value", [])
-    if skill_feats:
-        print(f"   {C.GREEN}Dons de compétence{C.RESET} Niv. {', '.join(map(str, skill_feats))}")
-    
-    skill_increases = system.get("skillIncreaseLevels", {}).get("value", [])
-    if skill_increases:
-        print(f"   {C.GREEN}Augm. compétences{C.RESET} Niv. {', '.join(map(str, skill_increases))}")
-    
-    print(f"{C.DIM}{'─' * w}{C.RESET}")
+    print(SEP_LINE)
     
     # === CAPACITÉS DE CLASSE ===
     class_items = system.get("items", {})
     if class_items:
         print(f"   {C.BOLD}Capacités de classe{C.RESET}")
         
-        # Trier par niveau
-        sorted_items = sorted(class_items.values(), key=lambda x: x.get("level", 0))
+        # Trier par niveau: clé lue une fois par capacité, tri stable sur itemgetter
+        by_level = [(item.get("level", 0), item) for item in class_items.values()]
+        by_level.sort(key=itemgetter(0))
         
-        for item in sorted_items:
+        for _, item in by_level:
             level = item.get("level", "?")
             name = item.get("name", "?")
             print(f"   {C.YELLOW}Niv.{level:>2}{C.RESET} {name}")
@@ -1001,176 +1101,145 @@ def display_class_full(system: dict, items: list, w: int):
         if title:
             print(f"\n   {C.DIM}Source: {title}{C.RESET}")
 
+# Affichage détaillé par type : toutes les entrées prennent (system, items, w)
+FULL_DISPLAYS = {
+    "créature": display_creature_full,
+    "compagnon": display_creature_full,
+    "classe": display_class_full,
+    "sort": lambda system, items, w: display_spell_full(system, w),
+    "don": lambda system, items, w: display_feat_full(system, w),
+    "équipement": lambda system, items, w: display_equipment_full(system, w),
+    "arme": lambda system, items, w: display_equipment_full(system, w),
+    "armure": lambda system, items, w: display_equipment_full(system, w),
+    "consommable": lambda system, items, w: display_equipment_full(system, w),
+    "action": lambda system, items, w: display_action_full(system, w),
+}
+
 # ============================================================================
 # RECHERCHE
 # ============================================================================
 
+# Entrées dont un trait contient :trait (minuscules), via l'index couvrant de entry_traits
+TRAIT_ROWIDS_SQL = "SELECT DISTINCT entry_rowid FROM entry_traits WHERE instr(trait_lower, :trait)"
+
+# Filtres type/pack/trait de forme fixe (NULL = pas de filtre): une seule requête
+# par variante, que sqlite3 garde préparée d'un appel à l'autre
+CANDIDATE_FILTERS_SQL = """(:type IS NULL OR e.type = :type) AND (:pack IS NULL OR e.pack LIKE :pack)
+    AND (:trait IS NULL OR e.rowid IN (""" + TRAIT_ROWIDS_SQL + "))"
+
+# Candidats lus dans l'index trigramme des noms normalisés (names_fts): le MATCH
+# reste seul dans la CTE, les filtres type/pack s'appliquent à la requête externe
+# (mêlés au MATCH, ils peuvent détourner SQLite de l'index FTS)
+NAME_CANDIDATES_SQL = """WITH m AS (SELECT rowid FROM names_fts WHERE names_fts MATCH :match)
+SELECT e.rowid, e.name_fr, e.name_fr_norm, e.name_en_norm FROM m JOIN entries e ON e.rowid = m.rowid
+WHERE """ + CANDIDATE_FILTERS_SQL
+
+# Moins de 3 caractères (pas de trigramme à chercher) ou base sans names_fts:
+# parcours des colonnes normalisées
+SHORT_NAME_CANDIDATES_SQL = """SELECT e.rowid, e.name_fr, e.name_fr_norm, e.name_en_norm FROM entries e
+WHERE (instr(e.name_fr_norm, :match) OR instr(e.name_en_norm, :match)) AND """ + CANDIDATE_FILTERS_SQL
+
+@lru_cache(maxsize=None)
+def has_names_fts(conn: sqlite3.Connection) -> bool:
+    """Vrai si la base a l'index trigramme des noms (absent si SQLite < 3.34 à l'extraction)."""
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'names_fts'").fetchone() is not None
+
+# Forme d'un identifiant Foundry (ASCII alphanumérique, tirets admis)
+RE_ENTRY_ID = re.compile(r'[A-Za-z0-9-]{8,}')
+
+@lru_cache(maxsize=8192)
+def load_entry(conn: sqlite3.Connection, rowid: int) -> Optional[dict]:
+    """Entrée décodée, gardée en mémoire: en interactif, les mêmes entrées
+    reviennent d'une recherche à l'autre. Les dicts renvoyés sont partagés
+    et ne doivent pas être modifiés."""
+    try:
+        return json_loads(conn.execute("SELECT data FROM entries WHERE rowid = ?", (rowid,)).fetchone()[0])
+    except (TypeError, ValueError):  # Ligne absente (None), JSON invalide
+        return None
+
+def load_entries(conn: sqlite3.Connection, rowids: List[int]) -> List[dict]:
+    """Décode le JSON des seules entrées retenues, dans l'ordre de rowids."""
+    entries = []
+    for rowid in rowids:
+        entry = load_entry(conn, rowid)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+def name_score(query: str, name_fr: str, name_en: str) -> int:
+    """Score d'un nom (normalisé) pour la requête (normalisée): exact > début > contient."""
+    if name_fr == query:
+        return 1000
+    if name_en == query:
+        return 950
+    if name_fr.startswith(query):
+        return 500
+    if name_en.startswith(query):
+        return 450
+    if query in name_fr:
+        return 200
+    if query in name_en:
+        return 150
+    return 0
+
 def search(query: str, conn: sqlite3.Connection, entry_type: str = None, 
            pack_filter: str = None, trait_filter: str = None, limit: int = 25) -> List[dict]:
     """Recherche et retourne des dictionnaires."""
-    query_lower = query.lower().strip()
-    query_normalized = normalize_text(query)
+    query_normalized = normalize_text(query.strip())
     cur = conn.cursor()
     
-    results = []
-    seen_keys = set()
-    
-    def add_results(sql: str, params: list, score: int):
-        cur.execute(sql, params)
-        for row in cur.fetchall():
-            try:
-                entry = json.loads(row[0])
-                
-                # Filtrer par trait si demandé
-                if trait_filter:
-                    traits = entry.get("system", {}).get("traits", {}).get("value", [])
-                    if not any(trait_filter.lower() in t.lower() for t in traits):
-                        continue
-                
-                key = f"{entry.get('_pack')}:{entry.get('_id')}"
-                if key not in seen_keys:
-                    seen_keys.add(key)
-                    results.append((score, entry))
-            except:
-                pass
-    
-    def add_entry_if_match(entry: dict, score: int):
-        """Ajoute une entrée si elle correspond à la recherche normalisée."""
-        # Filtrer par trait si demandé
-        if trait_filter:
-            traits = entry.get("system", {}).get("traits", {}).get("value", [])
-            if not any(trait_filter.lower() in t.lower() for t in traits):
-                return
-        
-        # Filtrer par type
-        if entry_type and entry.get("type") != entry_type:
-            return
-        
-        # Filtrer par pack
-        if pack_filter and pack_filter.lower() not in entry.get("_pack", "").lower():
-            return
-        
-        key = f"{entry.get('_pack')}:{entry.get('_id')}"
-        if key not in seen_keys:
-            seen_keys.add(key)
-            results.append((score, entry))
-    
     # UUID exact
-    if len(query) >= 8 and query.replace("-", "").isalnum():
+    if RE_ENTRY_ID.fullmatch(query):
         cur.execute("SELECT data FROM entries WHERE id = ?", (query,))
         row = cur.fetchone()
         if row:
             try:
-                return [json.loads(row[0])]
-            except:
+                return [json_loads(row[0])]
+            except ValueError:  # JSON invalide (json et orjson)
                 pass
     
-    # Filtres
-    type_clause = " AND type = ?" if entry_type else ""
-    pack_clause = " AND pack LIKE ?" if pack_filter else ""
-    
-    def params_with_filters(base_params):
-        p = list(base_params)
-        if entry_type:
-            p.append(entry_type)
-        if pack_filter:
-            p.append(f"%{pack_filter}%")
-        return p
-    
-    # Recherches par ordre de priorité (SQL standard)
-    queries = [
-        (f"SELECT data FROM entries WHERE LOWER(name_fr) = ?{type_clause}{pack_clause}", 1000),
-        (f"SELECT data FROM entries WHERE LOWER(name_en) = ?{type_clause}{pack_clause}", 950),
-        (f"SELECT data FROM entries WHERE LOWER(name_fr) LIKE ?{type_clause}{pack_clause}", 500),
-        (f"SELECT data FROM entries WHERE LOWER(name_en) LIKE ?{type_clause}{pack_clause}", 450),
-    ]
+    # Noms sans accents ni casse: "epee" trouve "Épée", un seul passage par l'index
+    if len(query_normalized) >= 3 and has_names_fts(conn):
+        # Chaîne FTS entre guillemets: la requête entière, comme sous-chaîne
+        sql = NAME_CANDIDATES_SQL
+        match = '"' + query_normalized.replace('"', '""') + '"'
+    else:
+        sql = SHORT_NAME_CANDIDATES_SQL
+        match = query_normalized
+    
+    params = {
+        "match": match,
+        "type": entry_type or None,
+        "pack": f"%{pack_filter}%" if pack_filter else None,
+        "trait": trait_filter.lower() if trait_filter else None,
+    }
     
-    for sql, score in queries[:2]:
-        add_results(sql, params_with_filters([query_lower]), score)
-    
-    for sql, score in queries[2:]:
-        add_results(sql, params_with_filters([query_lower + '%']), score)
-    
-    # Contient
-    add_results(
-        f"SELECT data FROM entries WHERE LOWER(name_fr) LIKE ?{type_clause}{pack_clause}",
-        params_with_filters(['%' + query_lower + '%']), 200
-    )
-    add_results(
-        f"SELECT data FROM entries WHERE LOWER(name_en) LIKE ?{type_clause}{pack_clause}",
-        params_with_filters(['%' + query_lower + '%']), 150
-    )
-    
-    # Recherche normalisée (sans accents) - nécessaire car SQLite LOWER() gère mal les accents
-    # Lance si peu de résultats OU si la requête contient des caractères accentués
-    has_accents = query_normalized != query_lower
-    if len(results) < 5 or has_accents:
-        # Recherche avec texte normalisé (gère é/e, à/a, etc.)
-        if entry_type:
-            cur.execute("SELECT data FROM entries WHERE type = ?", (entry_type,))
-        else:
-            cur.execute("SELECT data FROM entries")
-        
-        for row in cur.fetchall():
-            try:
-                entry = json.loads(row[0])
-                name_fr = entry.get("name_fr", "")
-                name_en = entry.get("name_en", "")
-                name_fr_norm = normalize_text(name_fr)
-                name_en_norm = normalize_text(name_en)
-                
-                # Match exact normalisé
-                if name_fr_norm == query_normalized:
-                    add_entry_if_match(entry, 900)
-                elif name_en_norm == query_normalized:
-                    add_entry_if_match(entry, 850)
-                # Commence par (normalisé)
-                elif name_fr_norm.startswith(query_normalized):
-                    add_entry_if_match(entry, 400)
-                elif name_en_norm.startswith(query_normalized):
-                    add_entry_if_match(entry, 350)
-                # Contient (normalisé)
-                elif query_normalized in name_fr_norm:
-                    add_entry_if_match(entry, 100)
-                elif query_normalized in name_en_norm:
-                    add_entry_if_match(entry, 50)
-            except:
-                pass
+    # Classement sur les seules colonnes de noms: le JSON n'est décodé que pour
+    # les entrées retenues
+    ranked = []
+    for rowid, name_fr, norm_fr, norm_en in cur.execute(sql, params):
+        score = name_score(query_normalized, norm_fr, norm_en)
+        if score:
+            ranked.append((-score, name_fr.lower(), rowid))
     
-    results.sort(key=lambda x: (-x[0], x[1].get("name_fr", "").lower()))
-    return [r[1] for r in results[:limit]]
+    # Seuls les limit premiers sont utiles: pas de tri complet des candidats
+    return load_entries(conn, [rowid for _, _, rowid in heapq.nsmallest(limit, ranked)])
 
 
 def list_by_trait(conn: sqlite3.Connection, trait: str, entry_type: str = None, limit: int = 50) -> List[dict]:
     """Liste toutes les entrées avec un trait donné."""
     cur = conn.cursor()
     
-    # Récupérer toutes les entrées et filtrer par trait
-    if entry_type:
-        cur.execute("SELECT data FROM entries WHERE type = ?", (entry_type,))
-    else:
-        cur.execute("SELECT data FROM entries")
+    # Entrées portant le trait, via entry_traits; niveau et nom lus dans leurs colonnes
+    cur.execute(
+        "SELECT rowid, level, name_fr FROM entries WHERE rowid IN (" + TRAIT_ROWIDS_SQL + ")"
+        " AND (:type IS NULL OR type = :type) ORDER BY rowid",
+        {"trait": trait.lower(), "type": entry_type or None})
     
-    results = []
-    trait_lower = trait.lower()
+    # Trier par niveau puis par nom, puis ne décoder que les entrées affichées
+    ranked = [(level, name_fr.lower(), rowid) for rowid, level, name_fr in cur]
     
-    for row in cur.fetchall():
-        try:
-            entry = json.loads(row[0])
-            traits = entry.get("system", {}).get("traits", {}).get("value", [])
-            
-            # Vérifier si le trait est présent
-            if any(trait_lower in t.lower() for t in traits):
-                level = entry.get("system", {}).get("level", {})
-                if isinstance(level, dict):
-                    level = level.get("value", 0)
-                results.append((level or 0, entry))
-        except:
-            pass
-    
-    # Trier par niveau puis par nom
-    results.sort(key=lambda x: (x[0], x[1].get("name_fr", "").lower()))
-    return [r[1] for r in results[:limit]]
+    return load_entries(conn, [rowid for _, _, rowid in heapq.nsmallest(limit, ranked, key=itemgetter(0, 1))])
 
 
 # ============================================================================
@@ -1197,6 +1266,19 @@ TYPE_SHORTCUTS = {
     "glossaire:": "glossaire", "gloss:": "glossaire", "ref:": "glossaire",  # Glossaire général
 }
 
+def split_type_shortcut(query: str) -> Tuple[Optional[str], str]:
+    """Sépare un préfixe de type ("sort: boule") du reste de la requête.
+    
+    Tous les raccourcis finissent par ":" sans en contenir d'autre: le texte
+    jusqu'au premier ":" est la seule clé possible, un accès direct au dict.
+    """
+    query_lower = query.lower()
+    end = query_lower.find(":") + 1
+    entry_type = TYPE_SHORTCUTS.get(query_lower[:end]) if end else None
+    if entry_type:
+        return entry_type, query[end:].strip()
+    return None, query
+
 def interactive(conn: sqlite3.Connection):
     """Mode interactif."""
     print(f"\n{C.BOLD}🔍 PF2e Search v5{C.RESET}")
@@ -1235,33 +1317,25 @@ def interactive(conn: sqlite3.Connection):
             cur = conn.cursor()
             cur.execute("SELECT type, COUNT(*) FROM entries GROUP BY type ORDER BY COUNT(*) DESC")
             print(f"\n{C.BOLD}📋 Types:{C.RESET}")
-            for row in cur.fetchall():
+            for row in cur:
                 print(f"   • {row[0]} ({row[1]})")
             continue
         
         if user_input.lower() == 'packs':
             cur = conn.cursor()
-            cur.execute("SELECT pack, COUNT(*) FROM entries GROUP BY pack ORDER BY COUNT(*) DESC")
+            cur.execute("SELECT pack, COUNT(*) FROM entries GROUP BY pack ORDER BY COUNT(*) DESC LIMIT 25")
             print(f"\n{C.BOLD}📦 Packs:{C.RESET}")
-            for row in cur.fetchall()[:25]:
+            for row in cur:
                 print(f"   • {row[0]} ({row[1]})")
             continue
         
         if user_input.lower() == 'traits':
-            # Lister les traits les plus courants
+            # Lister les traits les plus courants (à égalité: ordre de première apparition)
             cur = conn.cursor()
-            cur.execute("SELECT data FROM entries")
-            trait_counts = defaultdict(int)
-            for row in cur.fetchall():
-                try:
-                    data = json.loads(row[0])
-                    traits = data.get("system", {}).get("traits", {}).get("value", [])
-                    for t in traits:
-                        trait_counts[t] += 1
-                except:
-                    pass
+            cur.execute("SELECT trait, COUNT(*) FROM entry_traits GROUP BY trait "
+                        "ORDER BY COUNT(*) DESC, MIN(rowid) LIMIT 30")
             print(f"\n{C.BOLD}🏷️ Traits (top 30):{C.RESET}")
-            for trait, count in sorted(trait_counts.items(), key=lambda x: -x[1])[:30]:
+            for trait, count in cur:
                 print(f"   • {trait} ({count})")
             continue
         
@@ -1292,11 +1366,8 @@ def interactive(conn: sqlite3.Connection):
         query = user_input
         
         # Type filter
-        for prefix, t in TYPE_SHORTCUTS.items():
-            if query.lower().startswith(prefix):
-                entry_type = t
-                query = query[len(prefix):].strip()
-                break
+        shortcut_type, query = split_type_shortcut(query)
+        entry_type = shortcut_type or entry_type
         
         # Pack filter
         if query.lower().startswith("pack:"):
@@ -1377,9 +1448,36 @@ def main():
         print(f"Lancez: python pf2_extract_v5.py")
         return
     
+    args = sys.argv[1:]
+    preload = "--preload" in args
+    if preload:
+        args = [a for a in args if a != "--preload"]
+    
     conn = sqlite3.connect(str(DB_FILE))
+    if preload:
+        # Copie de toute la base (index compris) en mémoire: plus aucune
+        # lecture disque par recherche, au prix de la taille du fichier en RAM
+        mem_conn = sqlite3.connect(":memory:")
+        conn.backup(mem_conn)
+        conn.close()
+        conn = mem_conn
     cur = conn.cursor()
     
+    # Lecture seule: cache de 64 Mo, pages lues via mmap plutôt que read()
+    cur.execute('PRAGMA query_only=1')
+    cur.execute('PRAGMA cache_size=-65536')
+    cur.execute('PRAGMA mmap_size=268435456')
+    cur.execute('PRAGMA temp_store=MEMORY')
+    
+    # Bases produites avant la table des traits et les colonnes normalisées
+    # (names_fts, lui, est facultatif: voir has_names_fts)
+    cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'entry_traits'")
+    if not cur.fetchone():
+        print(f"\n{C.RED}Base d'une version antérieure (tables d'index absentes){C.RESET}")
+        print("Relancez: python pf2_extract_v6.py")
+        conn.close()
+        return
+    
     cur.execute("SELECT COUNT(*) FROM entries")
     total = cur.fetchone()[0]
     cur.execute("SELECT COUNT(*) FROM entries WHERE translated = 1")
@@ -1387,7 +1485,6 @@ def main():
     
     print(f"\n{C.GREEN}✓ {total} entrées ({trans} traduites){C.RESET}")
     
-    args = sys.argv[1:]
     
     if args:
         # Mode CLI
@@ -1413,11 +1510,8 @@ def main():
         query = " ".join(query_parts)
         
         # Shortcuts
-        for prefix, t in TYPE_SHORTCUTS.items():
-            if query.lower().startswith(prefix):
-                entry_type = t
-                query = query[len(prefix):].strip()
-                break
+        shortcut_type, query = split_type_shortcut(query)
+        entry_type = shortcut_type or entry_type
         
         if query.lower().startswith("pack:"):
             rest = query[5:].strip()